@@ -6,4 +6,9 @@ This package contains the PydanticAI agent implementations for:
 - Data Analysis Agent
 - Insight Generator Agent
 - Visualization Agent
+
+Agents added here must be built lazily, on first use, by cached factory
+functions, and must import heavy dependencies (pandas, numpy, pydantic_ai)
+inside those factories rather than at module level, so that importing the
+API process stays cheap.
 """ 
\ No newline at end of file
@@ -0,0 +1,5 @@
+"""Threshold and trend-deviation alerting for KPI data."""
+from app.alerts.engine import Alert, AlertEngine, alert_engine
+from app.alerts.rules import Rule, RuleIndex
+
+__all__ = ["Alert", "AlertEngine", "alert_engine", "Rule", "RuleIndex"]
@@ -0,0 +1,288 @@
+"""Incremental alert evaluation for newly ingested KPI data."""
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from app.alerts.rules import (
+    DEFAULT_DEVIATION_THRESHOLD, DEFAULT_WINDOW_SIZE, OPERATORS, SEVERITY_RANK,
+    RollingWindow, Rule, RuleIndex,
+)
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+RULES_QUERY = """
+    SELECT id, name, kpi_id, team_id, region_id, rule_type, operator,
+           threshold, window_size, severity
+    FROM alert_rules
+    WHERE active
+"""
+
+# Trigger-maintained version of alert_rules, used like the dimension cache's version
+RULES_VERSION_QUERY = """
+    SELECT COALESCE(SUM(version), 0)
+    FROM table_versions
+    WHERE table_name = 'alert_rules'
+"""
+
+# Latest values of every series matching a deviation rule, oldest first per
+# series. Series are enumerated from the small dimension tables.
+SEED_WINDOW_SQL = """
+    SELECT t.id AS team_id, r.id AS region_id, recent.value
+    FROM teams t
+    CROSS JOIN regions r
+    JOIN LATERAL (
+        SELECT id, value, timestamp
+        FROM kpi_data
+        WHERE kpi_id = :kpi_id AND team_id = t.id AND region_id = r.id
+        ORDER BY timestamp DESC, id DESC
+        LIMIT :window_size
+    ) AS recent ON true
+    {where}
+    ORDER BY t.id, r.id, recent.timestamp, recent.id
+"""
+
+
+@dataclass(frozen=True)
+class Alert:
+    """An alert raised by a rule for one series."""
+    rule_id: int
+    rule_name: str
+    kpi_id: int
+    team_id: int
+    region_id: int
+    severity: str
+    value: float
+    expected: Optional[float]
+    score: float
+    timestamp: datetime
+    kpi_data_id: Optional[int]
+    message: str
+
+    @property
+    def priority(self):
+        """Sort key: severity first, then how far the value is off."""
+        return (SEVERITY_RANK.get(self.severity, 0), self.score)
+
+
+class AlertEngine:
+    """
+    Evaluates ingested batches against the matching rules only.
+
+    Deviation rules keep a rolling window per series. An alert is raised when a
+    series enters the breached state and is not repeated until the series
+    recovers, so sustained breaches produce a single alert.
+
+    Window and breach state live in this process only. Every row of a series
+    must therefore be ingested by the same process (a single ingestion worker,
+    or workers partitioned by series key); API workers that never ingest do
+    not need the engine. Batches must only be passed in after their
+    transaction has committed, so a rollback never advances the state.
+    """
+
+    def __init__(self, rules=(), check_interval=None):
+        """Initialize the engine with an optional set of rules."""
+        self.index = RuleIndex(rules)
+        self.check_interval = (
+            settings.ALERT_RULES_CHECK_INTERVAL
+            if check_interval is None else check_interval
+        )
+        self._version = None
+        self._checked_at = 0.0
+        self._windows = {}
+        self._breached = set()
+        self._lock = threading.Lock()
+
+    def load_rules(self, connector=None):
+        """
+        Replace the rule set with the active rules from the database.
+
+        Window and breach state is kept for rules whose definition is unchanged.
+        Windows of new or changed deviation rules are filled from the latest
+        stored values, so they can alert straight away instead of after
+        ``window_size`` new points. Call this before ingesting a batch, never
+        between its commit and ``process_batch``, or the batch is counted twice.
+        """
+        if connector is None:
+            from app.db.connector import db_connector
+            connector = db_connector
+
+        version = int(connector.execute_query(RULES_VERSION_QUERY, use_primary=True)[0][0])
+        rules = [Rule.from_model(row) for row in connector.execute_query(RULES_QUERY, use_primary=True)]
+        unchanged = {rule.id for rule in rules if self.index.get(rule.id) == rule}
+        seeded = self._seed_windows(
+            [rule for rule in rules if rule.id not in unchanged], connector
+        )
+        with self._lock:
+            self.index = RuleIndex(rules)
+            self._windows = {k: w for k, w in self._windows.items() if k[0] in unchanged}
+            self._windows.update(seeded)
+            self._breached = {k for k in self._breached if k[0] in unchanged}
+            self._version = version
+            self._checked_at = time.monotonic()
+        logger.info(f"Loaded {len(rules)} alert rules at version {version}")
+
+    def refresh_rules(self, connector=None):
+        """Reload the rules if alert_rules changed, checking at most once per interval."""
+        if time.monotonic() - self._checked_at < self.check_interval:
+            return
+        if connector is None:
+            from app.db.connector import db_connector
+            connector = db_connector
+
+        version = int(connector.execute_query(RULES_VERSION_QUERY, use_primary=True)[0][0])
+        if version != self._version:
+            self.load_rules(connector)
+        else:
+            self._checked_at = time.monotonic()
+
+    @staticmethod
+    def _seed_windows(rules, connector):
+        """Build windows for deviation rules from each matching series' latest values."""
+        windows = {}
+        for rule in rules:
+            if rule.rule_type != "deviation":
+                continue
+            size = rule.window_size or DEFAULT_WINDOW_SIZE
+            clauses = []
+            params = {"kpi_id": rule.kpi_id, "window_size": size}
+            if rule.team_id is not None:
+                clauses.append("t.id = :team_id")
+                params["team_id"] = rule.team_id
+            if rule.region_id is not None:
+                clauses.append("r.id = :region_id")
+                params["region_id"] = rule.region_id
+            where = "WHERE " + " AND ".join(clauses) if clauses else ""
+
+            sql = SEED_WINDOW_SQL.format(where=where)
+            for row in connector.execute_query(sql, params, use_primary=True):
+                key = (rule.id, row.team_id, row.region_id)
+                window = windows.get(key)
+                if window is None:
+                    window = windows[key] = RollingWindow(size)
+                window.push(row.value)
+        return windows
+
+    def add_rule(self, rule):
+        """Add or replace a single rule."""
+        with self._lock:
+            self._forget(rule.id)
+            self.index.add(rule)
+
+    def remove_rule(self, rule_id):
+        """Remove a single rule and its state."""
+        with self._lock:
+            self._forget(rule_id)
+            self.index.remove(rule_id)
+
+    def release_alerts(self, alerts):
+        """
+        Clear breach state for alerts that could not be stored.
+
+        The series then alerts again on its next breaching value instead of
+        staying silent for the rest of the breach.
+        """
+        with self._lock:
+            for alert in alerts:
+                self._breached.discard((alert.rule_id, alert.team_id, alert.region_id))
+
+    def process_batch(self, rows):
+        """
+        Check a batch of KPI data rows and return new alerts, highest priority first.
+
+        Rows need kpi_id, team_id, region_id, value and timestamp attributes;
+        an id attribute is used when present.
+        """
+        alerts = []
+        with self._lock:
+            for row in sorted(rows, key=lambda r: r.timestamp):
+                for rule in self.index.match(row.kpi_id, row.team_id, row.region_id):
+                    alert = self._evaluate(rule, row)
+                    if alert is not None:
+                        alerts.append(alert)
+        alerts.sort(key=lambda a: a.priority, reverse=True)
+        return alerts
+
+    def _evaluate(self, rule, row):
+        """Evaluate one rule against one row, updating breach state."""
+        state_key = (rule.id, row.team_id, row.region_id)
+        if rule.rule_type == "threshold":
+            breached, expected, score = self._check_threshold(rule, row.value)
+        elif rule.rule_type == "deviation":
+            breached, expected, score = self._check_deviation(rule, state_key, row.value)
+        else:
+            logger.warning(f"Unknown rule type '{rule.rule_type}' for rule {rule.id}")
+            return None
+
+        if not breached:
+            self._breached.discard(state_key)
+            return None
+        if state_key in self._breached:
+            return None
+        self._breached.add(state_key)
+
+        return Alert(
+            rule_id=rule.id,
+            rule_name=rule.name,
+            kpi_id=row.kpi_id,
+            team_id=row.team_id,
+            region_id=row.region_id,
+            severity=rule.severity,
+            value=row.value,
+            expected=expected,
+            score=score,
+            timestamp=row.timestamp,
+            kpi_data_id=getattr(row, "id", None),
+            message=self._message(rule, row.value, expected),
+        )
+
+    @staticmethod
+    def _check_threshold(rule, value):
+        """Return (breached, expected, score) for a threshold rule."""
+        compare = OPERATORS.get(rule.operator)
+        if compare is None or rule.threshold is None:
+            return False, None, 0.0
+        breached = compare(value, rule.threshold)
+        scale = abs(rule.threshold) or 1.0
+        return breached, rule.threshold, abs(value - rule.threshold) / scale
+
+    def _check_deviation(self, rule, state_key, value):
+        """Return (breached, expected, score) for a deviation rule."""
+        window = self._windows.get(state_key)
+        if window is None:
+            window = self._windows[state_key] = RollingWindow(rule.window_size or DEFAULT_WINDOW_SIZE)
+
+        breached, expected, score = False, None, 0.0
+        if window.full:
+            mean, std = window.mean_std()
+            expected = mean
+            if std > 0:
+                score = abs(value - mean) / std
+                threshold = DEFAULT_DEVIATION_THRESHOLD if rule.threshold is None else rule.threshold
+                breached = score > threshold
+            elif value != mean:
+                # A flat series that moves at all is a deviation; score the
+                # move relative to the level so it can still be prioritized
+                score = abs(value - mean) / (abs(mean) or 1.0)
+                breached = True
+        window.push(value)
+        return breached, expected, score
+
+    @staticmethod
+    def _message(rule, value, expected):
+        """Build a short human-readable alert message."""
+        if rule.rule_type == "threshold":
+            return f"{rule.name}: value {value:g} {rule.operator} {expected:g}"
+        return f"{rule.name}: value {value:g} deviates from rolling mean {expected:g}"
+
+    def _forget(self, rule_id):
+        """Drop window and breach state for a rule."""
+        self._windows = {k: w for k, w in self._windows.items() if k[0] != rule_id}
+        self._breached = {k for k in self._breached if k[0] != rule_id}
+
+
+# Shared instance fed by the ingestion path
+alert_engine = AlertEngine()
@@ -0,0 +1,136 @@
+"""Alert rules and the series-keyed rule index."""
+import math
+import operator
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional
+
+SEVERITY_RANK = {"low": 1, "medium": 2, "high": 3}
+
+# Used by deviation rules that leave window_size or threshold unset
+DEFAULT_WINDOW_SIZE = 30
+DEFAULT_DEVIATION_THRESHOLD = 3.0
+
+OPERATORS = {
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+}
+
+
+@dataclass(frozen=True)
+class Rule:
+    """In-memory copy of an alert rule."""
+    id: int
+    name: str
+    kpi_id: int
+    team_id: Optional[int]
+    region_id: Optional[int]
+    rule_type: str
+    operator: Optional[str] = None
+    threshold: Optional[float] = None
+    window_size: Optional[int] = None
+    severity: str = "medium"
+
+    @classmethod
+    def from_model(cls, model):
+        """Build a rule from an AlertRule row."""
+        return cls(
+            id=model.id,
+            name=model.name,
+            kpi_id=model.kpi_id,
+            team_id=model.team_id,
+            region_id=model.region_id,
+            rule_type=model.rule_type,
+            operator=model.operator,
+            threshold=model.threshold,
+            window_size=model.window_size,
+            severity=model.severity,
+        )
+
+    @property
+    def key(self):
+        """Series key this rule is indexed under; None acts as a wildcard."""
+        return (self.kpi_id, self.team_id, self.region_id)
+
+
+class RollingWindow:
+    """Fixed-size window of the most recent values of a series."""
+
+    def __init__(self, size):
+        """Initialize an empty window."""
+        self.values = deque(maxlen=size)
+
+    def push(self, value):
+        """Add a value, evicting the oldest one when the window is full."""
+        self.values.append(value)
+
+    @property
+    def full(self):
+        """Whether the window holds ``size`` values."""
+        return len(self.values) == self.values.maxlen
+
+    def mean_std(self):
+        """
+        Return the mean and population standard deviation of the window.
+
+        Computed in two passes over the bounded window rather than from running
+        sums, which lose all precision for large values and drift over time.
+        """
+        n = len(self.values)
+        mean = math.fsum(self.values) / n
+        variance = math.fsum((value - mean) ** 2 for value in self.values) / n
+        return mean, math.sqrt(variance)
+
+
+class RuleIndex:
+    """
+    Rules grouped by (kpi_id, team_id, region_id).
+
+    A data point can only match rules stored under its exact key or under the
+    wildcard variants of it, so lookup is four dict reads regardless of how
+    many rules exist.
+    """
+
+    def __init__(self, rules=()):
+        """Build the index from rules."""
+        self._by_key = {}
+        self._by_id = {}
+        for rule in rules:
+            self.add(rule)
+
+    def __len__(self):
+        return len(self._by_id)
+
+    def get(self, rule_id):
+        """Return a rule by id, or None."""
+        return self._by_id.get(rule_id)
+
+    def add(self, rule):
+        """Add or replace a rule."""
+        self.remove(rule.id)
+        self._by_id[rule.id] = rule
+        self._by_key.setdefault(rule.key, []).append(rule)
+
+    def remove(self, rule_id):
+        """Remove a rule if present."""
+        rule = self._by_id.pop(rule_id, None)
+        if rule is None:
+            return
+        bucket = self._by_key[rule.key]
+        bucket.remove(rule)
+        if not bucket:
+            del self._by_key[rule.key]
+
+    def match(self, kpi_id, team_id, region_id):
+        """Return every rule that applies to a data point's series."""
+        matched = []
+        for key in (
+            (kpi_id, team_id, region_id),
+            (kpi_id, team_id, None),
+            (kpi_id, None, region_id),
+            (kpi_id, None, None),
+        ):
+            matched.extend(self._by_key.get(key, ()))
+        return matched
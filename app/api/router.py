@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from app.api.v1.endpoints import kpi_queries
+from app.api.v1.endpoints import kpi_queries, kpi_data, goals, alerts
 
 api_router = APIRouter()
 
@@ -8,4 +8,22 @@ api_router.include_router(
     kpi_queries.router, 
     prefix="/v1/queries", 
     tags=["queries"]
-) 
\ No newline at end of file
+) 
+
+api_router.include_router(
+    kpi_data.router,
+    prefix="/v1/kpi-data",
+    tags=["kpi-data"]
+)
+
+api_router.include_router(
+    goals.router,
+    prefix="/v1/goals",
+    tags=["goals"]
+)
+
+api_router.include_router(
+    alerts.router,
+    prefix="/v1/alerts",
+    tags=["alerts"]
+)
\ No newline at end of file
@@ -0,0 +1,75 @@
+from datetime import datetime
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query
+from pydantic import BaseModel
+
+from app.alerts.rules import SEVERITY_RANK
+from app.api.deps import get_api_key
+from app.db.connector import db_connector
+from app.db.dimensions import dimension_cache
+
+router = APIRouter()
+
+# Same priority as Alert.priority: severity first, then score
+SEVERITY_RANK_SQL = "CASE a.severity {} ELSE 0 END".format(
+    " ".join(f"WHEN '{severity}' THEN {rank}" for severity, rank in SEVERITY_RANK.items())
+)
+
+RECENT_ALERTS_QUERY = """
+    SELECT a.id, a.kpi_data_id, a.rule_id, a.description, a.severity, a.score, a.created_at,
+           d.kpi_id, d.team_id, d.region_id, d.value, d.timestamp
+    FROM anomalies a
+    JOIN kpi_data d ON d.id = a.kpi_data_id
+    {where}
+    ORDER BY """ + SEVERITY_RANK_SQL + """ DESC, a.score DESC NULLS LAST, a.id DESC
+    LIMIT :limit
+"""
+
+class AlertItem(BaseModel):
+    """Model for a stored alert."""
+    id: int
+    kpi_data_id: int
+    rule_id: Optional[int]
+    kpi: Optional[str]
+    team: Optional[str]
+    region: Optional[str]
+    value: float
+    timestamp: datetime
+    severity: str
+    score: Optional[float]
+    description: Optional[str]
+    created_at: Optional[datetime]
+
+@router.get("/", response_model=List[AlertItem])
+def list_alerts(
+    severity: Optional[str] = Query(None, pattern="^(low|medium|high)$"),
+    limit: int = Query(100, ge=1, le=1000),
+    api_key: str = Depends(get_api_key)
+):
+    """List alerts raised during ingestion, highest severity and score first."""
+    params = {"limit": limit}
+    where = ""
+    if severity:
+        where = "WHERE a.severity = :severity"
+        params["severity"] = severity
+    rows = db_connector.execute_query(RECENT_ALERTS_QUERY.format(where=where), params)
+
+    snapshot = dimension_cache.snapshot()
+    return [
+        AlertItem(
+            id=row.id,
+            kpi_data_id=row.kpi_data_id,
+            rule_id=row.rule_id,
+            kpi=snapshot.kpis.get_name(row.kpi_id),
+            team=snapshot.teams.get_name(row.team_id),
+            region=snapshot.regions.get_name(row.region_id),
+            value=row.value,
+            timestamp=row.timestamp,
+            severity=row.severity,
+            score=row.score,
+            description=row.description,
+            created_at=row.created_at,
+        )
+        for row in rows
+    ]
@@ -0,0 +1,100 @@
+from datetime import date
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from pydantic import BaseModel
+
+from app.api.deps import get_api_key
+from app.db.connector import db_connector
+from app.db.dimensions import dimension_cache
+from app.db.goals import track_goal_progress
+from app.db.prefix_sums import period_to_date
+
+router = APIRouter()
+
+PERIOD_TYPES = {"mtd": "month", "qtd": "quarter", "ytd": "year"}
+
+class GoalProgressItem(BaseModel):
+    """Model for progress towards a single target."""
+    target_id: int
+    team: Optional[str]
+    region: Optional[str]
+    period_type: str
+    period_start: date
+    period_end: date
+    aggregation: str
+    target_value: float
+    actual_value: Optional[float]
+    progress: Optional[float]
+    data_points: int
+
+class PeriodAggregate(BaseModel):
+    """Model for a period-to-date aggregate of one team."""
+    team: Optional[str]
+    count: int
+    total: float
+    mean: Optional[float]
+    stddev: Optional[float]
+
+def _kpi_id(kpi):
+    """Resolve a KPI name to its id, or fail with 404."""
+    kpi_id = dimension_cache.kpi_id(kpi)
+    if kpi_id is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Unknown KPI: {kpi}")
+    return kpi_id
+
+@router.get("/progress", response_model=List[GoalProgressItem])
+def goal_progress(
+    kpi: str,
+    as_of: Optional[date] = None,
+    api_key: str = Depends(get_api_key)
+):
+    """Compare period-to-date actuals with the active targets for a KPI."""
+    kpi_id = _kpi_id(kpi)
+    with db_connector.get_read_session() as session:
+        progress = track_goal_progress(session, kpi_id, as_of)
+
+    snapshot = dimension_cache.snapshot()
+    return [
+        GoalProgressItem(
+            target_id=item.target_id,
+            team=snapshot.teams.get_name(item.team_id),
+            region=snapshot.regions.get_name(item.region_id) if item.region_id else None,
+            period_type=item.period_type,
+            period_start=item.period_start,
+            period_end=item.period_end,
+            aggregation=item.aggregation,
+            target_value=item.target_value,
+            actual_value=item.actual_value,
+            progress=item.progress,
+            data_points=item.data_points,
+        )
+        for item in progress
+    ]
+
+@router.get("/{period}", response_model=List[PeriodAggregate])
+def period_to_date_aggregates(
+    period: str,
+    kpi: str,
+    as_of: Optional[date] = None,
+    api_key: str = Depends(get_api_key)
+):
+    """Month-, quarter- or year-to-date aggregates (``mtd``, ``qtd``, ``ytd``) per team."""
+    if period not in PERIOD_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Unknown period: {period}"
+        )
+    aggregates = period_to_date(_kpi_id(kpi), PERIOD_TYPES[period], as_of)
+
+    snapshot = dimension_cache.snapshot()
+    return [
+        PeriodAggregate(
+            team=snapshot.teams.get_name(team_id),
+            count=aggregate.count,
+            total=aggregate.total,
+            mean=aggregate.mean,
+            stddev=aggregate.stddev,
+        )
+        for team_id, aggregate in aggregates.items()
+    ]
@@ -0,0 +1,94 @@
+from datetime import datetime
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import BaseModel
+
+from app.api.deps import get_api_key
+from app.db.dimensions import dimension_cache
+from app.db.kpi_data import InvalidCursorError, browse_kpi_data, estimate_kpi_data_count
+
+router = APIRouter()
+
+class KPIDataRow(BaseModel):
+    """Model for a single raw KPI data row."""
+    id: int
+    kpi: Optional[str]
+    team: Optional[str]
+    region: Optional[str]
+    value: float
+    timestamp: datetime
+    year: int
+    quarter: int
+    month: int
+    week: Optional[int]
+
+class KPIDataPage(BaseModel):
+    """Model for a page of raw KPI data rows."""
+    items: List[KPIDataRow]
+    next_cursor: Optional[str]
+    approximate_total: int
+
+def _resolve(lookup, name, label):
+    """Resolve a dimension name to its id, or fail with 404."""
+    if name is None:
+        return None
+    row_id = lookup(name)
+    if row_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Unknown {label}: {name}"
+        )
+    return row_id
+
+@router.get("/", response_model=KPIDataPage)
+def list_kpi_data(
+    kpi: Optional[str] = None,
+    team: Optional[str] = None,
+    region: Optional[str] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    api_key: str = Depends(get_api_key)
+):
+    """
+    Browse raw KPI data rows, newest first.
+
+    Uses keyset pagination: pass ``next_cursor`` from the previous page as
+    ``cursor`` to get the next one. The total is a planner estimate.
+    """
+    filters = {
+        "kpi_id": _resolve(dimension_cache.kpi_id, kpi, "KPI"),
+        "team_id": _resolve(dimension_cache.team_id, team, "team"),
+        "region_id": _resolve(dimension_cache.region_id, region, "region"),
+        "start": start,
+        "end": end,
+    }
+
+    try:
+        rows, next_cursor = browse_kpi_data(cursor=cursor, limit=limit, **filters)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    snapshot = dimension_cache.snapshot()
+    items = [
+        KPIDataRow(
+            id=row.id,
+            kpi=snapshot.kpis.get_name(row.kpi_id),
+            team=snapshot.teams.get_name(row.team_id),
+            region=snapshot.regions.get_name(row.region_id),
+            value=row.value,
+            timestamp=row.timestamp,
+            year=row.year,
+            quarter=row.quarter,
+            month=row.month,
+            week=row.week,
+        )
+        for row in rows
+    ]
+    return KPIDataPage(
+        items=items,
+        next_cursor=next_cursor,
+        approximate_total=estimate_kpi_data_count(**filters),
+    )
@@ -23,6 +23,21 @@ class Settings:
         "DATABASE_URL", 
         f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
     )
+    # Comma-separated read replica URLs; reads fall back to the primary when empty
+    DATABASE_REPLICA_URLS: list = [
+        url.strip() for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if url.strip()
+    ]
+    DB_PRIMARY_POOL_SIZE: int = int(os.getenv("DB_PRIMARY_POOL_SIZE", "10"))
+    DB_PRIMARY_MAX_OVERFLOW: int = int(os.getenv("DB_PRIMARY_MAX_OVERFLOW", "10"))
+    DB_REPLICA_POOL_SIZE: int = int(os.getenv("DB_REPLICA_POOL_SIZE", "20"))
+    DB_REPLICA_MAX_OVERFLOW: int = int(os.getenv("DB_REPLICA_MAX_OVERFLOW", "20"))
+    DB_CONNECT_TIMEOUT: int = int(os.getenv("DB_CONNECT_TIMEOUT", "5"))
+    DB_REPLICA_CONNECT_TIMEOUT: int = int(os.getenv("DB_REPLICA_CONNECT_TIMEOUT", "1"))
+    DB_REPLICA_MAX_LAG_SECONDS: float = float(os.getenv("DB_REPLICA_MAX_LAG_SECONDS", "30"))
+    DB_REPLICA_CHECK_INTERVAL: float = float(os.getenv("DB_REPLICA_CHECK_INTERVAL", "10"))
+    DB_WARM_UP: bool = os.getenv("DB_WARM_UP", "True").lower() in ("true", "1", "t")
+    DIMENSION_CACHE_CHECK_INTERVAL: float = float(os.getenv("DIMENSION_CACHE_CHECK_INTERVAL", "30"))
+    ALERT_RULES_CHECK_INTERVAL: float = float(os.getenv("ALERT_RULES_CHECK_INTERVAL", "30"))
     
     # OpenAI API Settings (for PydanticAI)
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
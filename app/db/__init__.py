@@ -1,4 +1,5 @@
 """Database utilities and connection handling."""
 from app.db.connector import db_connector
+from app.db.dimensions import dimension_cache
 
-__all__ = ["db_connector"] 
\ No newline at end of file
+__all__ = ["db_connector", "dimension_cache"] 
\ No newline at end of file
@@ -0,0 +1,184 @@
+"""
+Window-function SQL for period-over-period and ranking analytics.
+
+Each builder compiles structured parameters into a single statement so the
+database does the grouping, period matching and ranking work and only the
+final comparison rows are returned.
+"""
+from app.db.connector import db_connector
+from app.db.dimensions import dimension_cache
+
+# Only these identifiers are ever formatted into SQL
+PERIOD_COLUMNS = {
+    "year": ["year"],
+    "quarter": ["year", "quarter"],
+    "month": ["year", "month"],
+}
+GROUP_COLUMNS = {"team": "team_id", "region": "region_id"}
+AGGREGATES = {"avg": "AVG", "sum": "SUM"}
+# (RANK order, PERCENT_RANK order): rank 1 and percentile 1.0 are the best team
+RANK_ORDERS = {"higher": ("DESC", "ASC"), "lower": ("ASC", "DESC")}
+
+# period2 is the current period and period1 the previous one, whichever is
+# earlier. The FULL JOIN keeps groups with data in only one of the periods,
+# with value or previous_value NULL, so a group that stopped reporting shows up.
+COMPARE_PERIODS_SQL = """
+    WITH periods AS (
+        SELECT {group_column} AS group_id,
+               ({period_columns}) = ({period2}) AS is_current,
+               {aggregate}(value) AS value
+        FROM kpi_data
+        WHERE kpi_id = :kpi_id
+          AND ({period_columns}) IN (({period1}), ({period2}))
+          {filters}
+        GROUP BY {group_column}, {period_columns}
+    )
+    SELECT COALESCE(cur.group_id, prev.group_id) AS group_id,
+           cur.value AS value,
+           prev.value AS previous_value,
+           cur.value - prev.value AS delta,
+           (cur.value - prev.value) / NULLIF(prev.value, 0) AS pct_change
+    FROM (SELECT group_id, value FROM periods WHERE is_current) AS cur
+    FULL JOIN (SELECT group_id, value FROM periods WHERE NOT is_current) AS prev
+        ON prev.group_id = cur.group_id
+    ORDER BY 1
+"""
+
+BENCHMARK_SQL = """
+    WITH team_values AS (
+        SELECT team_id, {aggregate}(value) AS value
+        FROM kpi_data
+        WHERE kpi_id = :kpi_id
+          AND ({period_columns}) = ({period})
+          {filters}
+        GROUP BY team_id
+    ),
+    ranked AS (
+        SELECT team_id, value,
+               RANK() OVER (ORDER BY value {rank_order}) AS rank,
+               PERCENT_RANK() OVER (ORDER BY value {percentile_order}) AS percentile,
+               AVG(value) OVER () AS all_teams_avg,
+               COUNT(*) OVER () AS team_count
+        FROM team_values
+    )
+    SELECT team_id, value, rank, percentile, all_teams_avg, team_count,
+           value - all_teams_avg AS delta_from_avg
+    FROM ranked
+    {report_filter}
+    ORDER BY rank
+"""
+
+
+def _resolve_ids(lookup, names, label):
+    """Resolve dimension names to ids, failing on unknown names."""
+    ids = []
+    for name in names:
+        row_id = lookup(name)
+        if row_id is None:
+            raise ValueError(f"Unknown {label}: {name}")
+        ids.append(row_id)
+    return ids
+
+
+def _period_values(period, prefix, params):
+    """Add a period's bind parameters and return their placeholders."""
+    placeholders = []
+    for column in PERIOD_COLUMNS[period.granularity]:
+        name = f"{prefix}_{column}"
+        params[name] = getattr(period, column)
+        placeholders.append(f":{name}")
+    return ", ".join(placeholders)
+
+
+def _dimension_filters(snapshot, params, teams=(), regions=()):
+    """Build team/region filter clauses for kpi_data."""
+    clauses = []
+    if teams:
+        params["team_ids"] = _resolve_ids(snapshot.teams.get_id, teams, "team")
+        clauses.append("AND team_id = ANY(:team_ids)")
+    if regions:
+        params["region_ids"] = _resolve_ids(snapshot.regions.get_id, regions, "region")
+        clauses.append("AND region_id = ANY(:region_ids)")
+    return "\n          ".join(clauses)
+
+
+def _kpi_id(snapshot, kpi):
+    """Resolve a KPI name to its id."""
+    return _resolve_ids(snapshot.kpis.get_id, [kpi], "KPI")[0]
+
+
+def build_compare_periods(params, snapshot=None):
+    """Compile ComparisonParameters into (sql, bind parameters)."""
+    snapshot = snapshot or dimension_cache.snapshot()
+    bind = {"kpi_id": _kpi_id(snapshot, params.kpi)}
+    sql = COMPARE_PERIODS_SQL.format(
+        group_column=GROUP_COLUMNS[params.group_by],
+        period_columns=", ".join(PERIOD_COLUMNS[params.period1.granularity]),
+        aggregate=AGGREGATES[params.aggregation],
+        period1=_period_values(params.period1, "p1", bind),
+        period2=_period_values(params.period2, "p2", bind),
+        filters=_dimension_filters(snapshot, bind, params.teams, params.regions),
+    )
+    return sql, bind
+
+
+def build_benchmark(params, snapshot=None):
+    """Compile BenchmarkParameters into (sql, bind parameters)."""
+    snapshot = snapshot or dimension_cache.snapshot()
+    kpi_id = _kpi_id(snapshot, params.kpi)
+    bind = {"kpi_id": kpi_id}
+    direction = params.direction
+    if direction is None:
+        direction = "higher" if snapshot.kpi_higher_is_better.get(kpi_id, True) else "lower"
+    rank_order, percentile_order = RANK_ORDERS[direction]
+    report_filter = ""
+    if params.teams:
+        bind["report_team_ids"] = _resolve_ids(snapshot.teams.get_id, params.teams, "team")
+        report_filter = "WHERE team_id = ANY(:report_team_ids)"
+    sql = BENCHMARK_SQL.format(
+        aggregate=AGGREGATES[params.aggregation],
+        rank_order=rank_order,
+        percentile_order=percentile_order,
+        period_columns=", ".join(PERIOD_COLUMNS[params.period.granularity]),
+        period=_period_values(params.period, "p", bind),
+        filters=_dimension_filters(snapshot, bind, regions=params.regions),
+        report_filter=report_filter,
+    )
+    return sql, bind
+
+
+def compare_periods(params, connector=None):
+    """Compare a KPI between two periods per team or region, computed in the database."""
+    connector = connector or db_connector
+    snapshot = dimension_cache.snapshot()
+    sql, bind = build_compare_periods(params, snapshot)
+    table = snapshot.teams if params.group_by == "team" else snapshot.regions
+    return [
+        {
+            params.group_by: table.get_name(row.group_id),
+            "value": row.value,
+            "previous_value": row.previous_value,
+            "delta": row.delta,
+            "pct_change": row.pct_change,
+        }
+        for row in connector.execute_query(sql, bind)
+    ]
+
+
+def benchmark_performance(params, connector=None):
+    """Rank teams on a KPI within a period, computed in the database."""
+    connector = connector or db_connector
+    snapshot = dimension_cache.snapshot()
+    sql, bind = build_benchmark(params, snapshot)
+    return [
+        {
+            "team": snapshot.teams.get_name(row.team_id),
+            "value": row.value,
+            "rank": row.rank,
+            "percentile": row.percentile,
+            "all_teams_avg": row.all_teams_avg,
+            "delta_from_avg": row.delta_from_avg,
+            "team_count": row.team_count,
+        }
+        for row in connector.execute_query(sql, bind)
+    ]
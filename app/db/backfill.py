@@ -0,0 +1,265 @@
+"""
+Batched, resumable data backfills for large tables.
+
+A job's id range is split into disjoint slices, one per worker. Each worker
+walks its slice in id order, one chunk per short transaction, and records the
+last processed id in backfill_checkpoints in the same transaction as the
+update. An interrupted job resumes from the checkpoints on the next run.
+
+The last worker's slice is open-ended: when it reaches its end it re-reads
+MAX(id) and continues with rows inserted during the run. Rows inserted after
+it finishes are not covered, so application code must already write the new
+value for new rows before a job is started.
+"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app.db.connector import db_connector
+
+logger = logging.getLogger(__name__)
+
+# Whitelisted tables that jobs may target
+BACKFILL_TABLES = {"kpi_data", "kpi_daily_totals", "anomalies"}
+
+NEXT_CHUNK_SQL = """
+    SELECT MAX(id) FROM (
+        SELECT id FROM {table}
+        WHERE id > :last_id AND id <= :end_id
+        ORDER BY id
+        LIMIT :chunk_size
+    ) AS chunk
+"""
+
+SAVE_CHECKPOINT_SQL = """
+    UPDATE backfill_checkpoints
+    SET last_id = :last_id, rows_processed = rows_processed + :rows,
+        status = :status, updated_at = now()
+    WHERE job_name = :job_name AND worker = :worker
+"""
+
+
+@dataclass(frozen=True)
+class BackfillJob:
+    """
+    A chunked update over a table.
+
+    ``update_sql`` must restrict itself to ``id > :start_id AND id <= :end_id``;
+    it is run once per chunk with those bounds.
+    """
+    name: str
+    table: str
+    update_sql: str
+    chunk_size: int = 5000
+    sleep_seconds: float = 0.1
+    lock_timeout: str = "2s"
+    max_attempts: int = 5  # per chunk, for lock timeouts and dropped connections
+    retry_backoff: float = 1.0  # seconds, doubled after each failed attempt
+
+
+# Built-in jobs, runnable via scripts/backfill.py
+JOBS = {
+    "recompute_week": BackfillJob(
+        name="recompute_week",
+        table="kpi_data",
+        update_sql="""
+            UPDATE kpi_data
+            SET week = CAST(EXTRACT(WEEK FROM timestamp) AS INTEGER)
+            WHERE id > :start_id AND id <= :end_id
+              AND week IS DISTINCT FROM CAST(EXTRACT(WEEK FROM timestamp) AS INTEGER)
+        """,
+    ),
+}
+
+
+def plan_job(job, workers, connector=None):
+    """
+    Create checkpoints splitting the table's id range across workers.
+
+    Existing checkpoints for the job are kept, so re-planning a started job is
+    a no-op. ``workers`` is capped at the number of ids in the table. Returns
+    the number of workers the job is planned for.
+    """
+    if job.table not in BACKFILL_TABLES:
+        raise ValueError(f"Table not allowed for backfill: {job.table}")
+    connector = connector or db_connector
+
+    with connector.get_session() as session:
+        existing = session.execute(
+            text("SELECT COUNT(*) FROM backfill_checkpoints WHERE job_name = :job_name"),
+            {"job_name": job.name},
+        ).scalar()
+        if existing:
+            return existing
+
+        min_id, max_id = session.execute(
+            text(f"SELECT MIN(id), MAX(id) FROM {job.table}")
+        ).fetchone()
+        if max_id is None:
+            # Empty table: a single slice ending at 0, extended to rows inserted during the run
+            min_id, max_id = 1, 0
+        span = max_id - min_id + 1
+        # No more workers than ids, so no slice starts past max_id and the
+        # last worker's open end picks up every row inserted during the run
+        workers = max(1, min(workers, span))
+        step = -(-span // workers)
+        for worker in range(workers):
+            start_id = min(min_id - 1 + worker * step, max_id)
+            end_id = min(start_id + step, max_id)
+            session.execute(
+                text("""
+                    INSERT INTO backfill_checkpoints
+                        (job_name, worker, start_id, end_id, last_id, rows_processed, status, created_at)
+                    VALUES (:job_name, :worker, :start_id, :end_id, :start_id, 0, 'pending', now())
+                """),
+                {"job_name": job.name, "worker": worker, "start_id": start_id, "end_id": end_id},
+            )
+    logger.info(f"Planned backfill '{job.name}' over ids {min_id}-{max_id} with {workers} workers")
+    return workers
+
+
+def _process_chunk(job, worker, last_id, end_id, connector):
+    """
+    Update the next chunk after ``last_id`` and save the checkpoint.
+
+    Returns (chunk_end, rows updated), or None when the slice is exhausted.
+    """
+    with connector.get_session() as session:
+        session.execute(text(f"SET LOCAL lock_timeout = '{job.lock_timeout}'"))
+        chunk_end = session.execute(
+            text(NEXT_CHUNK_SQL.format(table=job.table)),
+            {"last_id": last_id, "end_id": end_id, "chunk_size": job.chunk_size},
+        ).scalar()
+        if chunk_end is None:
+            return None
+
+        rows = session.execute(
+            text(job.update_sql), {"start_id": last_id, "end_id": chunk_end}
+        ).rowcount
+        session.execute(
+            text(SAVE_CHECKPOINT_SQL),
+            {"job_name": job.name, "worker": worker, "last_id": chunk_end,
+             "rows": rows, "status": "running"},
+        )
+    return chunk_end, rows
+
+
+def _process_chunk_with_retry(job, worker, last_id, end_id, connector, stop_event):
+    """Run one chunk, retrying lock timeouts and connection errors with backoff."""
+    for attempt in range(1, job.max_attempts + 1):
+        try:
+            return _process_chunk(job, worker, last_id, end_id, connector)
+        except OperationalError as e:
+            if attempt == job.max_attempts or (stop_event and stop_event.is_set()):
+                raise
+            delay = job.retry_backoff * 2 ** (attempt - 1)
+            logger.warning(
+                f"Backfill '{job.name}' worker {worker} chunk after id {last_id} failed "
+                f"(attempt {attempt}/{job.max_attempts}), retrying in {delay:.1f}s: {str(e)}"
+            )
+            time.sleep(delay)
+
+
+def _extend_last_slice(job, worker, end_id, connector):
+    """Move the last worker's end to the current MAX(id); returns the new end."""
+    with connector.get_session() as session:
+        max_id = session.execute(
+            text(f"SELECT COALESCE(MAX(id), 0) FROM {job.table}")
+        ).scalar()
+        if max_id <= end_id:
+            return end_id
+        session.execute(
+            text("""
+                UPDATE backfill_checkpoints SET end_id = :end_id, updated_at = now()
+                WHERE job_name = :job_name AND worker = :worker
+            """),
+            {"job_name": job.name, "worker": worker, "end_id": max_id},
+        )
+    return max_id
+
+
+def run_worker(job, worker, connector=None, stop_event=None):
+    """Process one worker's id slice from its checkpoint to the end, or until stopped."""
+    connector = connector or db_connector
+    with connector.get_session() as session:
+        last_id, end_id, status, last_worker = session.execute(
+            text("""
+                SELECT last_id, end_id, status,
+                       (SELECT MAX(worker) FROM backfill_checkpoints WHERE job_name = :job_name)
+                FROM backfill_checkpoints
+                WHERE job_name = :job_name AND worker = :worker
+            """),
+            {"job_name": job.name, "worker": worker},
+        ).fetchone()
+    if status == "done":
+        return 0
+
+    processed = 0
+    while not (stop_event and stop_event.is_set()):
+        chunk = _process_chunk_with_retry(job, worker, last_id, end_id, connector, stop_event)
+        if chunk is None:
+            if worker == last_worker:
+                new_end = _extend_last_slice(job, worker, end_id, connector)
+                if new_end > end_id:
+                    end_id = new_end
+                    continue
+            connector.execute_write(
+                SAVE_CHECKPOINT_SQL,
+                {"job_name": job.name, "worker": worker, "last_id": end_id,
+                 "rows": 0, "status": "done"},
+            )
+            break
+
+        last_id, rows = chunk
+        processed += rows
+        time.sleep(job.sleep_seconds)
+
+    logger.info(f"Backfill '{job.name}' worker {worker} finished, {processed} rows updated")
+    return processed
+
+
+def run_job(job, workers=4, connector=None):
+    """Plan the job if needed and run all workers in parallel. Returns rows updated."""
+    connector = connector or db_connector
+    planned = plan_job(job, workers, connector)
+    stop_event = threading.Event()
+    with ThreadPoolExecutor(max_workers=planned) as executor:
+        futures = [
+            executor.submit(run_worker, job, worker, connector, stop_event)
+            for worker in range(planned)
+        ]
+        try:
+            return sum(future.result() for future in futures)
+        except BaseException:
+            # Let the other workers finish their current chunk and stop
+            stop_event.set()
+            raise
+
+
+def job_status(job_name, connector=None):
+    """Return checkpoint rows for a job, one per worker."""
+    connector = connector or db_connector
+    return connector.execute_query(
+        """
+            SELECT worker, start_id, end_id, last_id, rows_processed, status, updated_at
+            FROM backfill_checkpoints
+            WHERE job_name = :job_name
+            ORDER BY worker
+        """,
+        {"job_name": job_name},
+        use_primary=True,
+    )
+
+
+def reset_job(job_name, connector=None):
+    """Delete a job's checkpoints so it can be planned and run again."""
+    connector = connector or db_connector
+    return connector.execute_write(
+        "DELETE FROM backfill_checkpoints WHERE job_name = :job_name",
+        {"job_name": job_name},
+    )
@@ -1,22 +1,37 @@
 """PostgreSQL database connector for the KPI Analytics System."""
 import logging
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError, SQLAlchemyError
 from contextlib import contextmanager
 
 from app.config import settings
+from app.db.engines import PRIMARY, REPLICA, get_engine, get_sessionmaker
+from app.db.routing import ReadRouter
 
 logger = logging.getLogger(__name__)
 
 class DatabaseConnector:
-    """Database connector for PostgreSQL."""
+    """
+    Database connector for PostgreSQL.
     
-    def __init__(self, database_url=None):
+    Writes go to the primary. Read-only queries are routed to a read replica
+    when any are configured and healthy, and run in read-only transactions.
+    """
+    
+    def __init__(self, database_url=None, replica_urls=None):
         """Initialize the database connector."""
         self.database_url = database_url or settings.DATABASE_URL
-        self.engine = create_engine(self.database_url)
-        self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        self.router = ReadRouter(self.database_url, replica_urls)
+    
+    @property
+    def engine(self):
+        """Shared engine for this connector's database, created on first use."""
+        return get_engine(self.database_url)
+    
+    @property
+    def SessionLocal(self):
+        """Session factory bound to the shared engine."""
+        return get_sessionmaker(self.database_url)
     
     @contextmanager
     def get_session(self):
@@ -32,16 +47,63 @@ class DatabaseConnector:
         finally:
             session.close()
     
-    def execute_query(self, query, params=None):
-        """Execute a raw SQL query and return the results."""
-        with self.get_session() as session:
+    @contextmanager
+    def get_read_session(self, use_primary=False):
+        """Get a read-only session on a replica (or the primary) with context management."""
+        url = self.database_url if use_primary else self.router.read_url()
+        with self._read_session(url) as session:
+            yield session
+    
+    @contextmanager
+    def _read_session(self, url):
+        """Read-only session on a given database; a failing replica is taken out of rotation."""
+        role = PRIMARY if url == self.database_url else REPLICA
+        session = get_sessionmaker(url, role)()
+        try:
+            session.execute(text("SET TRANSACTION READ ONLY"))
+            yield session
+        except SQLAlchemyError as e:
+            if isinstance(e, OperationalError) and url != self.database_url:
+                self.router.mark_unhealthy(url)
+            logger.error(f"Database error: {str(e)}")
+            raise
+        finally:
+            # Nothing to commit; close() ends the read-only transaction
+            session.close()
+    
+    def execute_query(self, query, params=None, use_primary=False):
+        """
+        Execute a read-only SQL query and return the results.
+        
+        Pass ``use_primary=True`` when the result must reflect the latest writes.
+        A query that fails on a replica with a connection-level error is
+        retried once on the primary.
+        """
+        url = self.database_url if use_primary else self.router.read_url()
+        try:
+            return self._fetch_all(url, query, params)
+        except OperationalError:
+            if url == self.database_url:
+                raise
+            logger.warning("Read replica query failed, retrying on the primary")
+            return self._fetch_all(self.database_url, query, params)
+    
+    def _fetch_all(self, url, query, params):
+        """Run a read-only query on one database and return all rows."""
+        with self._read_session(url) as session:
             result = session.execute(text(query), params or {})
             return result.fetchall()
     
+    def execute_write(self, query, params=None):
+        """Execute a raw SQL statement on the primary, commit, and return the row count."""
+        with self.get_session() as session:
+            result = session.execute(text(query), params or {})
+            return result.rowcount
+    
     def test_connection(self):
-        """Test the database connection."""
+        """Test the connection to the primary database."""
         try:
-            self.execute_query("SELECT 1")
+            self.execute_query("SELECT 1", use_primary=True)
             return True
         except Exception as e:
             logger.error(f"Connection test failed: {str(e)}")
@@ -0,0 +1,188 @@
+"""In-process cache for the small dimension tables (teams, regions, KPI definitions)."""
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+DIMENSION_TABLES = ("teams", "regions", "kpi_definitions")
+
+# Sum of the trigger-maintained versions of the dimension tables. Every write
+# statement bumps its table's row in the same transaction, so any committed
+# change moves the sum.
+VERSION_QUERY = """
+    SELECT COALESCE(SUM(version), 0)
+    FROM table_versions
+    WHERE table_name IN ('teams', 'regions', 'kpi_definitions')
+"""
+
+
+def normalize_name(name):
+    """Normalize a dimension name for lookups ("Social Media" -> "social media")."""
+    return " ".join(name.replace("_", " ").replace("-", " ").lower().split())
+
+
+def _freeze(mapping):
+    """Return a read-only view of a dict."""
+    return MappingProxyType(dict(mapping))
+
+
+def _unique_lookup(pairs, label, kind):
+    """Map keys to ids, dropping and logging keys that map to more than one id."""
+    lookup = {}
+    ambiguous = {}
+    for key, row_id in pairs:
+        if key in ambiguous:
+            ambiguous[key].add(row_id)
+        elif key in lookup and lookup[key] != row_id:
+            ambiguous[key] = {lookup.pop(key), row_id}
+        else:
+            lookup[key] = row_id
+    for key, row_ids in ambiguous.items():
+        logger.warning(f"Ambiguous {label} {kind} '{key}' used by ids {sorted(row_ids)}; ignoring it")
+    return lookup
+
+
+@dataclass(frozen=True)
+class DimensionTable:
+    """Immutable id <-> name maps for a single dimension table."""
+    names: Mapping[int, str]
+    ids: Mapping[str, int]
+    aliases: Mapping[str, int]
+
+    @classmethod
+    def from_rows(cls, rows, label="dimension"):
+        """
+        Build the maps from (id, name) rows.
+
+        Names are not unique in every table. A name or alias shared by several
+        ids is left out of the lookup maps, so it resolves to None instead of
+        to an arbitrary one of them.
+        """
+        names = {row_id: name for row_id, name in rows}
+        ids = _unique_lookup(((name, row_id) for row_id, name in rows), label, "name")
+        aliases = _unique_lookup(
+            ((normalize_name(name), row_id) for row_id, name in rows), label, "alias"
+        )
+        return cls(_freeze(names), _freeze(ids), _freeze(aliases))
+
+    def get_id(self, name):
+        """Resolve a name or alias to its id, or None if unknown."""
+        if name in self.ids:
+            return self.ids[name]
+        return self.aliases.get(normalize_name(name))
+
+    def get_name(self, row_id):
+        """Resolve an id to its name, or None if unknown."""
+        return self.names.get(row_id)
+
+
+@dataclass(frozen=True)
+class DimensionSnapshot:
+    """A consistent, immutable view of all dimension tables at one version."""
+    version: int
+    teams: DimensionTable
+    regions: DimensionTable
+    kpis: DimensionTable
+    kpi_units: Mapping[int, Optional[str]]
+    kpi_categories: Mapping[int, Optional[str]]
+    kpi_higher_is_better: Mapping[int, bool]
+
+
+class DimensionCache:
+    """
+    Loads the dimension tables once and serves lookups from memory.
+
+    The snapshot is reloaded when the tables' versions in table_versions
+    move. The counter is checked at most once per ``check_interval`` seconds,
+    so hot paths normally do no database work at all. Writers in this process
+    can call ``invalidate()`` to force a reload on the next access.
+    """
+
+    def __init__(self, connector=None, check_interval=None):
+        """Initialize the cache."""
+        self._connector = connector
+        self.check_interval = (
+            settings.DIMENSION_CACHE_CHECK_INTERVAL
+            if check_interval is None else check_interval
+        )
+        self._snapshot = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def connector(self):
+        """Database connector used to load the dimensions."""
+        if self._connector is None:
+            from app.db.connector import db_connector
+            self._connector = db_connector
+        return self._connector
+
+    def snapshot(self):
+        """Return the current snapshot, reloading it if the tables changed."""
+        snapshot = self._snapshot
+        if snapshot is not None and time.monotonic() - self._checked_at < self.check_interval:
+            return snapshot
+
+        with self._lock:
+            if self._snapshot is not None and time.monotonic() - self._checked_at < self.check_interval:
+                return self._snapshot
+            version = self._current_version()
+            if self._snapshot is None or self._snapshot.version != version:
+                self._snapshot = self._load(version)
+                logger.info(f"Loaded dimension snapshot at version {version}")
+            self._checked_at = time.monotonic()
+            return self._snapshot
+
+    def invalidate(self):
+        """Drop the current snapshot so the next access reloads it."""
+        with self._lock:
+            self._snapshot = None
+            self._checked_at = 0.0
+
+    def team_id(self, name):
+        """Resolve a team name or alias to its id."""
+        return self.snapshot().teams.get_id(name)
+
+    def region_id(self, name):
+        """Resolve a region name or alias to its id."""
+        return self.snapshot().regions.get_id(name)
+
+    def kpi_id(self, name):
+        """Resolve a KPI name or alias to its id."""
+        return self.snapshot().kpis.get_id(name)
+
+    def _current_version(self):
+        """Read the version of the dimension tables."""
+        # Read from the primary so a lagging replica cannot hide a change
+        result = self.connector.execute_query(VERSION_QUERY, use_primary=True)
+        return int(result[0][0]) if result else 0
+
+    def _load(self, version):
+        """Read all dimension tables into a new snapshot."""
+        # Read from the primary so the snapshot matches the version just read
+        query = self.connector.execute_query
+        teams = query("SELECT id, name FROM teams", use_primary=True)
+        regions = query("SELECT id, name FROM regions", use_primary=True)
+        kpis = query(
+            "SELECT id, name, unit, category, higher_is_better FROM kpi_definitions",
+            use_primary=True,
+        )
+        return DimensionSnapshot(
+            version=version,
+            teams=DimensionTable.from_rows(teams, "team"),
+            regions=DimensionTable.from_rows(regions, "region"),
+            kpis=DimensionTable.from_rows([(row[0], row[1]) for row in kpis], "KPI"),
+            kpi_units=_freeze({row[0]: row[2] for row in kpis}),
+            kpi_categories=_freeze({row[0]: row[3] for row in kpis}),
+            kpi_higher_is_better=_freeze({row[0]: row[4] for row in kpis}),
+        )
+
+
+# Shared instance used by the interpreter, ingestion and exports
+dimension_cache = DimensionCache()
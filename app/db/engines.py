@@ -0,0 +1,71 @@
+"""Shared, lazily created SQLAlchemy engines."""
+import threading
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.config import settings
+
+_engines = {}
+_sessionmakers = {}
+_lock = threading.Lock()
+
+
+PRIMARY = "primary"
+REPLICA = "replica"
+
+
+def pool_options(role=PRIMARY):
+    """Pool settings for a role: replicas serve many short reads, the primary takes ingestion."""
+    if role == REPLICA:
+        pool_size, max_overflow = settings.DB_REPLICA_POOL_SIZE, settings.DB_REPLICA_MAX_OVERFLOW
+        # Fail fast so a dead replica is dropped instead of stalling reads
+        connect_timeout = settings.DB_REPLICA_CONNECT_TIMEOUT
+    else:
+        pool_size, max_overflow = settings.DB_PRIMARY_POOL_SIZE, settings.DB_PRIMARY_MAX_OVERFLOW
+        connect_timeout = settings.DB_CONNECT_TIMEOUT
+    return {
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_pre_ping": True,
+        "connect_args": {"connect_timeout": connect_timeout},
+    }
+
+
+def get_engine(database_url=None, role=PRIMARY, **engine_kwargs):
+    """
+    Return the engine for a database URL, creating it on first use.
+
+    Every caller asking for the same URL shares one engine and therefore one
+    connection pool. ``role`` (``PRIMARY`` or ``REPLICA``) selects the
+    ``pool_options``; it and ``engine_kwargs``, which override them, only
+    apply when the engine is created.
+    """
+    url = database_url or settings.DATABASE_URL
+    engine = _engines.get(url)
+    if engine is not None:
+        return engine
+
+    with _lock:
+        if url not in _engines:
+            _engines[url] = create_engine(url, **{**pool_options(role), **engine_kwargs})
+        return _engines[url]
+
+
+def get_sessionmaker(database_url=None, role=PRIMARY):
+    """Return the session factory bound to the engine for a database URL."""
+    url = database_url or settings.DATABASE_URL
+    factory = _sessionmakers.get(url)
+    if factory is None:
+        factory = sessionmaker(autocommit=False, autoflush=False, bind=get_engine(url, role))
+        _sessionmakers.setdefault(url, factory)
+    return _sessionmakers[url]
+
+
+def dispose_engines():
+    """Close all pooled connections, e.g. after forking a worker."""
+    with _lock:
+        for engine in _engines.values():
+            engine.dispose()
+        _engines.clear()
+        _sessionmakers.clear()
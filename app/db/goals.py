@@ -0,0 +1,98 @@
+"""Goal tracking against KPI targets using the running daily totals."""
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Optional
+
+from app.db.prefix_sums import period_end, range_aggregates
+
+
+@dataclass(frozen=True)
+class GoalProgress:
+    """Actual-to-date value of a KPI compared with its target."""
+    target_id: int
+    kpi_id: int
+    team_id: int
+    region_id: Optional[int]
+    period_type: str
+    period_start: date
+    period_end: date
+    aggregation: str
+    target_value: float
+    actual_value: Optional[float]
+    data_points: int
+
+    @property
+    def progress(self):
+        """Actual as a fraction of the target, or None if not computable."""
+        if self.actual_value is None or not self.target_value:
+            return None
+        return self.actual_value / self.target_value
+
+
+# No period is longer than a year, so older targets can never be active
+MAX_PERIOD_DAYS = 366
+
+
+def get_active_targets(session, kpi_id, as_of, team_ids=None):
+    """Return the targets for a KPI whose period contains ``as_of``."""
+    from app.models import KPITarget
+
+    query = session.query(KPITarget).filter(
+        KPITarget.kpi_id == kpi_id,
+        KPITarget.period_start <= as_of,
+        KPITarget.period_start > as_of - timedelta(days=MAX_PERIOD_DAYS),
+    )
+    if team_ids:
+        query = query.filter(KPITarget.team_id.in_(team_ids))
+    return [
+        target for target in query.all()
+        if period_end(target.period_type, target.period_start) >= as_of
+    ]
+
+
+def track_goal_progress(session, kpi_id, as_of=None, team_ids=None, connector=None):
+    """
+    Compare period-to-date actuals with every active target for a KPI.
+
+    Targets sharing a period and region are answered by a single range query
+    covering all of their teams.
+    """
+    as_of = as_of or date.today()
+    targets = get_active_targets(session, kpi_id, as_of, team_ids)
+
+    groups = defaultdict(list)
+    for target in targets:
+        groups[(target.period_start, target.region_id)].append(target)
+
+    progress = []
+    for (start, region_id), group in groups.items():
+        aggregates = range_aggregates(
+            kpi_id,
+            start,
+            as_of,
+            team_ids=[target.team_id for target in group],
+            region_ids=[region_id] if region_id is not None else None,
+            connector=connector,
+        )
+        for target in group:
+            aggregate = aggregates.get(target.team_id)
+            if aggregate is None:
+                actual, count = None, 0
+            else:
+                actual = aggregate.mean if target.aggregation == "avg" else float(aggregate.total)
+                count = aggregate.count
+            progress.append(GoalProgress(
+                target_id=target.id,
+                kpi_id=kpi_id,
+                team_id=target.team_id,
+                region_id=target.region_id,
+                period_type=target.period_type,
+                period_start=target.period_start,
+                period_end=period_end(target.period_type, target.period_start),
+                aggregation=target.aggregation,
+                target_value=target.target_value,
+                actual_value=actual,
+                data_points=count,
+            ))
+    return progress
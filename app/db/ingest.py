@@ -0,0 +1,77 @@
+"""Ingestion of new KPI data rows."""
+import logging
+from collections import namedtuple
+
+from sqlalchemy import text
+
+from app.alerts import alert_engine
+from app.db.connector import db_connector
+from app.db.prefix_sums import update_daily_totals
+from app.models import KPIData
+
+logger = logging.getLogger(__name__)
+
+# Plain copy of an inserted row that stays usable after its session closes
+IngestedRow = namedtuple(
+    "IngestedRow", ["id", "kpi_id", "team_id", "region_id", "value", "timestamp"]
+)
+
+SAVE_ALERT_SQL = """
+    INSERT INTO anomalies (kpi_data_id, rule_id, description, severity, score, created_at)
+    VALUES (:kpi_data_id, :rule_id, :description, :severity, :score, now())
+"""
+
+
+def ingest_kpi_data(data_points, connector=None):
+    """
+    Insert a batch of KPI data points and run the incremental post-ingest steps.
+
+    ``data_points`` is a list of dicts with KPIData column values. The rows and
+    their running daily totals are committed together; alert state only
+    advances once that commit has succeeded. Alerts are stored as anomalies.
+    Returns a tuple of (inserted rows, alerts raised by the batch).
+    """
+    connector = connector or db_connector
+    # Before the insert, so rule windows seeded from stored data exclude this batch
+    alert_engine.refresh_rules(connector)
+    with connector.get_session() as session:
+        records = [KPIData(**data) for data in data_points]
+        session.add_all(records)
+        session.flush()  # Assigns ids so alerts can reference the rows
+        update_daily_totals(session, records)
+        rows = [
+            IngestedRow(r.id, r.kpi_id, r.team_id, r.region_id, r.value, r.timestamp)
+            for r in records
+        ]
+
+    alerts = alert_engine.process_batch(rows)
+    if alerts:
+        save_alerts(alerts, connector)
+        logger.info(f"Ingested {len(rows)} KPI data points, raised {len(alerts)} alerts")
+    return rows, alerts
+
+
+def save_alerts(alerts, connector=None):
+    """
+    Store alerts as anomaly rows linked to the data points and rules that raised them.
+
+    If the alerts cannot be stored, their breach state is cleared so the
+    series alerts again on its next breaching value.
+    """
+    connector = connector or db_connector
+    try:
+        with connector.get_session() as session:
+            session.execute(text(SAVE_ALERT_SQL), [
+                {
+                    "kpi_data_id": alert.kpi_data_id,
+                    "rule_id": alert.rule_id,
+                    "description": alert.message,
+                    "severity": alert.severity,
+                    "score": alert.score,
+                }
+                for alert in alerts
+            ])
+    except Exception as e:
+        # The data itself is committed, so ingestion does not fail here
+        alert_engine.release_alerts(alerts)
+        logger.error(f"Failed to save {len(alerts)} alerts, they will be raised again: {str(e)}")
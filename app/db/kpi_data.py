@@ -0,0 +1,106 @@
+"""Keyset-paginated browsing of raw KPI data rows."""
+import base64
+import json
+from datetime import datetime
+
+from app.db.connector import db_connector
+
+# Matches idx_kpi_data_timestamp_id and the (kpi|team|region)_timestamp_id
+# indexes, so every page is an index range scan starting right after the
+# cursor. Combined filters seek on the most selective of those indexes and
+# check the remaining columns on the fly.
+BROWSE_QUERY = """
+    SELECT id, kpi_id, team_id, region_id, value, timestamp,
+           year, quarter, month, week
+    FROM kpi_data
+    {where}
+    ORDER BY timestamp DESC, id DESC
+    LIMIT :limit
+"""
+
+COUNT_ESTIMATE_QUERY = "EXPLAIN (FORMAT JSON) SELECT 1 FROM kpi_data {where}"
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def encode_cursor(timestamp, row_id):
+    """Encode the position of the last row on a page as an opaque cursor."""
+    payload = json.dumps({"t": timestamp.isoformat(), "i": row_id})
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    """Decode a cursor back into a (timestamp, id) pair."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(payload["t"]), int(payload["i"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from e
+
+
+def _build_filters(kpi_id=None, team_id=None, region_id=None, start=None, end=None):
+    """Build the WHERE clauses and parameters shared by page and count queries."""
+    clauses = []
+    params = {}
+    if kpi_id is not None:
+        clauses.append("kpi_id = :kpi_id")
+        params["kpi_id"] = kpi_id
+    if team_id is not None:
+        clauses.append("team_id = :team_id")
+        params["team_id"] = team_id
+    if region_id is not None:
+        clauses.append("region_id = :region_id")
+        params["region_id"] = region_id
+    if start is not None:
+        clauses.append("timestamp >= :start")
+        params["start"] = start
+    if end is not None:
+        clauses.append("timestamp < :end")
+        params["end"] = end
+    return clauses, params
+
+
+def _where(clauses):
+    """Join clauses into a WHERE statement."""
+    return "WHERE " + " AND ".join(clauses) if clauses else ""
+
+
+def browse_kpi_data(cursor=None, limit=100, connector=None, **filters):
+    """
+    Return one page of KPI data rows, newest first.
+
+    Returns a tuple of (rows, next_cursor); next_cursor is None on the last page.
+    """
+    connector = connector or db_connector
+    clauses, params = _build_filters(**filters)
+    if cursor:
+        after_timestamp, after_id = decode_cursor(cursor)
+        clauses.append("(timestamp, id) < (:after_timestamp, :after_id)")
+        params.update(after_timestamp=after_timestamp, after_id=after_id)
+
+    # Fetch one extra row to know whether another page exists
+    params["limit"] = limit + 1
+    rows = connector.execute_query(BROWSE_QUERY.format(where=_where(clauses)), params)
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(last.timestamp, last.id)
+    return rows, next_cursor
+
+
+def estimate_kpi_data_count(connector=None, **filters):
+    """Estimate the number of matching rows from planner statistics."""
+    connector = connector or db_connector
+    clauses, params = _build_filters(**filters)
+    result = connector.execute_query(
+        COUNT_ESTIMATE_QUERY.format(where=_where(clauses)), params
+    )
+    plan = result[0][0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
@@ -0,0 +1,218 @@
+"""
+Per-series cumulative daily totals for period-to-date and range aggregates.
+
+Each kpi_daily_totals row stores the running count, sum and sum of squares of
+a (kpi, team, region) series up to and including that day, so the aggregate
+over any day range is the difference of two rows found by index seeks.
+
+The running sums are NUMERIC and handled as Decimal. Range results are
+differences of ever-growing totals, which in floating point would lose the
+precision of recent days to the magnitude of the whole history.
+"""
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, timedelta
+from decimal import Decimal, localcontext
+
+from sqlalchemy import text
+
+from app.db.connector import db_connector
+
+# Serializes updates to one series until the transaction ends. Without it, a
+# transaction adding a later day could copy totals that a concurrent update
+# to an earlier day never reaches.
+SERIES_LOCK_SQL = """
+    SELECT pg_advisory_xact_lock(
+        hashtext(concat_ws(':', 'kpi_daily_totals', :kpi_id, :team_id, :region_id))
+    )
+"""
+
+# Carry the previous day's totals forward into a new day row
+INSERT_DAY_SQL = """
+    INSERT INTO kpi_daily_totals
+        (kpi_id, team_id, region_id, day, cum_count, cum_sum, cum_sumsq, created_at)
+    SELECT :kpi_id, :team_id, :region_id, :day,
+           COALESCE(prev.cum_count, 0), COALESCE(prev.cum_sum, 0), COALESCE(prev.cum_sumsq, 0),
+           now()
+    FROM (SELECT 1) AS one
+    LEFT JOIN LATERAL (
+        SELECT cum_count, cum_sum, cum_sumsq
+        FROM kpi_daily_totals
+        WHERE kpi_id = :kpi_id AND team_id = :team_id AND region_id = :region_id
+          AND day < :day
+        ORDER BY day DESC
+        LIMIT 1
+    ) AS prev ON true
+    ON CONFLICT (kpi_id, team_id, region_id, day) DO NOTHING
+"""
+
+# Adding to a day shifts every later running total by the same amount. For
+# normal in-order ingestion that is only the row for the newest day.
+APPLY_DELTA_SQL = """
+    UPDATE kpi_daily_totals
+    SET cum_count = cum_count + :count,
+        cum_sum = cum_sum + :total,
+        cum_sumsq = cum_sumsq + :total_sq
+    WHERE kpi_id = :kpi_id AND team_id = :team_id AND region_id = :region_id
+      AND day >= :day
+"""
+
+# Two seeks per series: the last row on or before `end` and the last row
+# before `start`. Series are enumerated from the small dimension tables.
+RANGE_SQL = """
+    SELECT t.id AS team_id, r.id AS region_id,
+           upper.cum_count - COALESCE(lower.cum_count, 0) AS count,
+           upper.cum_sum - COALESCE(lower.cum_sum, 0) AS total,
+           upper.cum_sumsq - COALESCE(lower.cum_sumsq, 0) AS total_sq
+    FROM teams t
+    CROSS JOIN regions r
+    JOIN LATERAL (
+        SELECT cum_count, cum_sum, cum_sumsq
+        FROM kpi_daily_totals
+        WHERE kpi_id = :kpi_id AND team_id = t.id AND region_id = r.id AND day <= :end
+        ORDER BY day DESC
+        LIMIT 1
+    ) AS upper ON true
+    LEFT JOIN LATERAL (
+        SELECT cum_count, cum_sum, cum_sumsq
+        FROM kpi_daily_totals
+        WHERE kpi_id = :kpi_id AND team_id = t.id AND region_id = r.id AND day < :start
+        ORDER BY day DESC
+        LIMIT 1
+    ) AS lower ON true
+    {where}
+"""
+
+REBUILD_SQL = """
+    INSERT INTO kpi_daily_totals
+        (kpi_id, team_id, region_id, day, cum_count, cum_sum, cum_sumsq, created_at)
+    SELECT kpi_id, team_id, region_id, day,
+           SUM(n) OVER w, SUM(s) OVER w, SUM(sq) OVER w, now()
+    FROM (
+        SELECT kpi_id, team_id, region_id, CAST(timestamp AS DATE) AS day,
+               COUNT(*) AS n, SUM(CAST(value AS NUMERIC)) AS s,
+               SUM(CAST(value AS NUMERIC) * CAST(value AS NUMERIC)) AS sq
+        FROM kpi_data
+        GROUP BY kpi_id, team_id, region_id, CAST(timestamp AS DATE)
+    ) AS daily
+    WINDOW w AS (PARTITION BY kpi_id, team_id, region_id ORDER BY day)
+"""
+
+
+def to_decimal(value):
+    """Convert a float value the way PostgreSQL casts float8 to numeric (15 significant digits)."""
+    return Decimal(f"{value:.15g}")
+
+
+@dataclass(frozen=True)
+class RangeAggregate:
+    """Count, sum and sum of squares over a day range."""
+    count: int = 0
+    total: Decimal = Decimal(0)
+    total_sq: Decimal = Decimal(0)
+
+    def __add__(self, other):
+        return RangeAggregate(
+            self.count + other.count,
+            self.total + other.total,
+            self.total_sq + other.total_sq,
+        )
+
+    @property
+    def mean(self):
+        """Average value, or None when there are no rows."""
+        return float(self.total / self.count) if self.count else None
+
+    @property
+    def stddev(self):
+        """Population standard deviation, or None when there are no rows."""
+        if not self.count:
+            return None
+        # Exact inputs, so E[x^2] - mean^2 only needs enough working digits
+        with localcontext() as context:
+            context.prec = 50
+            variance = (self.total_sq - self.total * self.total / self.count) / self.count
+            return float(max(variance, Decimal(0)).sqrt())
+
+
+def update_daily_totals(session, records):
+    """Fold a batch of new KPIData rows into the running totals."""
+    deltas = defaultdict(lambda: [0, Decimal(0), Decimal(0)])
+    with localcontext() as context:
+        context.prec = 50
+        for record in records:
+            key = (record.kpi_id, record.team_id, record.region_id, record.timestamp.date())
+            value = to_decimal(record.value)
+            delta = deltas[key]
+            delta[0] += 1
+            delta[1] += value
+            delta[2] += value * value
+
+    # Sorted order means concurrent batches take series locks in the same order
+    locked = set()
+    for (kpi_id, team_id, region_id, day), (count, total, total_sq) in sorted(deltas.items()):
+        params = {"kpi_id": kpi_id, "team_id": team_id, "region_id": region_id, "day": day}
+        if (kpi_id, team_id, region_id) not in locked:
+            session.execute(text(SERIES_LOCK_SQL), params)
+            locked.add((kpi_id, team_id, region_id))
+        session.execute(text(INSERT_DAY_SQL), params)
+        session.execute(
+            text(APPLY_DELTA_SQL),
+            {**params, "count": count, "total": total, "total_sq": total_sq},
+        )
+
+
+def rebuild_daily_totals(session):
+    """Recompute all running totals from kpi_data, blocking ingestion meanwhile."""
+    session.execute(text("LOCK TABLE kpi_data IN SHARE MODE"))
+    session.execute(text("LOCK TABLE kpi_daily_totals IN EXCLUSIVE MODE"))
+    session.execute(text("DELETE FROM kpi_daily_totals"))
+    session.execute(text(REBUILD_SQL))
+
+
+def range_aggregates(kpi_id, start, end, team_ids=None, region_ids=None, connector=None):
+    """
+    Aggregate a KPI over the inclusive day range [start, end], per team.
+
+    Returns a dict of team_id -> RangeAggregate, summed over the matching regions.
+    """
+    connector = connector or db_connector
+    clauses = []
+    params = {"kpi_id": kpi_id, "start": start, "end": end}
+    if team_ids:
+        clauses.append("t.id = ANY(:team_ids)")
+        params["team_ids"] = list(team_ids)
+    if region_ids:
+        clauses.append("r.id = ANY(:region_ids)")
+        params["region_ids"] = list(region_ids)
+    where = "WHERE " + " AND ".join(clauses) if clauses else ""
+
+    results = defaultdict(RangeAggregate)
+    for row in connector.execute_query(RANGE_SQL.format(where=where), params):
+        results[row.team_id] += RangeAggregate(row.count, row.total, row.total_sq)
+    return dict(results)
+
+
+def period_start(period_type, as_of):
+    """Return the first day of the month, quarter or year containing ``as_of``."""
+    if period_type == "month":
+        return as_of.replace(day=1)
+    if period_type == "quarter":
+        return date(as_of.year, 3 * ((as_of.month - 1) // 3) + 1, 1)
+    if period_type == "year":
+        return date(as_of.year, 1, 1)
+    raise ValueError(f"Unknown period type: {period_type}")
+
+
+def period_end(period_type, start):
+    """Return the last day of the period beginning on ``start``."""
+    months = {"month": 1, "quarter": 3, "year": 12}[period_type]
+    month_index = start.month - 1 + months
+    next_start = date(start.year + month_index // 12, month_index % 12 + 1, 1)
+    return next_start - timedelta(days=1)
+
+
+def period_to_date(kpi_id, period_type, as_of=None, **filters):
+    """Month-, quarter- or year-to-date aggregates per team."""
+    as_of = as_of or date.today()
+    return range_aggregates(kpi_id, period_start(period_type, as_of), as_of, **filters)
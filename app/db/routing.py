@@ -0,0 +1,142 @@
+"""Routing of read-only queries across the primary and its read replicas."""
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import text
+
+from app.config import settings
+from app.db.engines import REPLICA, get_engine
+
+logger = logging.getLogger(__name__)
+
+# Replay lag in seconds, or NULL when the replica is not streaming from the
+# primary. A streaming replica that has replayed everything it received is
+# treated as current even if the primary has been idle for a while; without
+# the streaming check, a disconnected replica's frozen LSNs would look current.
+LAG_QUERY = """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN NOT EXISTS (
+            SELECT 1 FROM pg_stat_wal_receiver WHERE status = 'streaming'
+        ) THEN NULL
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+"""
+
+# Replicas whose lag is this close to the best one share the read load
+LAG_TOLERANCE_SECONDS = 1.0
+
+
+def safe_url(url):
+    """Strip credentials from a database URL for logging."""
+    return url.rsplit("@", 1)[-1]
+
+
+@dataclass
+class ReplicaStatus:
+    """Last known health of a read replica."""
+    url: str
+    healthy: bool = False
+    lag: Optional[float] = None
+    checked_at: float = 0.0
+
+
+class ReadRouter:
+    """
+    Chooses the database that serves a read-only query.
+
+    Replicas are health-checked every ``check_interval`` seconds by a
+    background thread started on the first read, so requests never wait on a
+    check. Reads go to a healthy replica within ``max_lag`` seconds of the
+    primary, preferring the least lagged ones; otherwise they go to the primary.
+    A replica marked unhealthy is skipped until a later check finds it healthy.
+    """
+
+    def __init__(self, primary_url=None, replica_urls=None, max_lag=None, check_interval=None):
+        """Initialize the router."""
+        self.primary_url = primary_url or settings.DATABASE_URL
+        urls = settings.DATABASE_REPLICA_URLS if replica_urls is None else replica_urls
+        self.replicas = [ReplicaStatus(url) for url in urls]
+        self.max_lag = settings.DB_REPLICA_MAX_LAG_SECONDS if max_lag is None else max_lag
+        self.check_interval = (
+            settings.DB_REPLICA_CHECK_INTERVAL if check_interval is None else check_interval
+        )
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def read_url(self):
+        """Return the URL that should serve the next read-only query."""
+        if not self.replicas:
+            return self.primary_url
+        if self._thread is None:
+            self.start()
+
+        candidates = [
+            replica for replica in self.replicas
+            if replica.healthy and replica.lag is not None and replica.lag <= self.max_lag
+        ]
+        if not candidates:
+            return self.primary_url
+        best_lag = min(replica.lag for replica in candidates)
+        return random.choice([
+            replica.url for replica in candidates
+            if replica.lag <= best_lag + LAG_TOLERANCE_SECONDS
+        ])
+
+    def start(self):
+        """Start the background health checker if it is not running."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="replica-health-check", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self):
+        """Stop the background health checker."""
+        self._stop.set()
+
+    def check(self):
+        """Refresh the health and lag of every replica now."""
+        for replica in self.replicas:
+            self._check_replica(replica)
+
+    def _run(self):
+        """Health-check loop run by the background thread."""
+        while not self._stop.is_set():
+            self.check()
+            self._stop.wait(self.check_interval)
+
+    def mark_unhealthy(self, url):
+        """Take a replica out of rotation until its next health check."""
+        for replica in self.replicas:
+            if replica.url == url:
+                replica.healthy = False
+                logger.warning(f"Replica marked unhealthy: {safe_url(url)}")
+
+    @staticmethod
+    def _check_replica(replica):
+        """Measure one replica's lag, marking it unhealthy on failure."""
+        try:
+            with get_engine(replica.url, REPLICA).connect() as connection:
+                lag = connection.execute(text(LAG_QUERY)).scalar()
+            if lag is None:
+                if replica.healthy:
+                    logger.warning(f"Replica is not streaming from the primary: {safe_url(replica.url)}")
+                replica.healthy = False
+                replica.lag = None
+            else:
+                replica.healthy = True
+                replica.lag = float(lag)
+        except Exception as e:
+            replica.healthy = False
+            replica.lag = None
+            logger.warning(f"Replica health check failed for {safe_url(replica.url)}: {str(e)}")
+        replica.checked_at = time.monotonic()
@@ -6,6 +6,11 @@ from app.models.tables import (
     KPIDefinition, 
     KPIData, 
     Anomaly, 
+    KPIDailyTotal,
+    KPITarget,
+    AlertRule,
+    BackfillCheckpoint,
+    TableVersion,
     QueryHistory
 )
 
@@ -16,5 +21,10 @@ __all__ = [
     "KPIDefinition",
     "KPIData",
     "Anomaly",
+    "KPIDailyTotal",
+    "KPITarget",
+    "AlertRule",
+    "BackfillCheckpoint",
+    "TableVersion",
     "QueryHistory"
 ] 
\ No newline at end of file
@@ -1,6 +1,10 @@
 """Database table models for the KPI Analytics System."""
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Index
+from sqlalchemy import (
+    Column, Integer, BigInteger, String, Float, Numeric, Date, DateTime, ForeignKey, Index, Boolean,
+    UniqueConstraint, DDL, event
+)
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import true
 
 from app.models.base import Base
 
@@ -34,6 +38,7 @@ class KPIDefinition(Base):
     description = Column(String, nullable=True)
     unit = Column(String(50))
     category = Column(String(100))
+    higher_is_better = Column(Boolean, nullable=False, default=True, server_default=true())
     
     # Relationships
     kpi_data = relationship("KPIData", back_populates="kpi_definition")
@@ -65,6 +70,11 @@ class KPIData(Base):
         Index("idx_kpi_data_team_id", team_id),
         Index("idx_kpi_data_region_id", region_id),
         Index("idx_kpi_data_time", year, quarter, month),
+        # Keyset pagination over (timestamp, id), unfiltered or with one equality filter
+        Index("idx_kpi_data_timestamp_id", timestamp, "id"),
+        Index("idx_kpi_data_kpi_timestamp_id", kpi_id, timestamp, "id"),
+        Index("idx_kpi_data_team_timestamp_id", team_id, timestamp, "id"),
+        Index("idx_kpi_data_region_timestamp_id", region_id, timestamp, "id"),
     )
 
 
@@ -73,17 +83,130 @@ class Anomaly(Base):
     __tablename__ = "anomalies"
     
     kpi_data_id = Column(Integer, ForeignKey("kpi_data.id"), nullable=False)
+    rule_id = Column(Integer, ForeignKey("alert_rules.id", ondelete="SET NULL"), nullable=True)  # alert rule that raised it
     description = Column(String, nullable=True)
     severity = Column(String(20), nullable=False)  # 'low', 'medium', 'high'
+    score = Column(Float, nullable=True)  # how far the value is off, for ordering within a severity
     
     # Relationships
     kpi_data = relationship("KPIData", back_populates="anomalies")
 
 
+class KPIDailyTotal(Base):
+    """Running totals per KPI series and day, for O(1) range aggregates."""
+    __tablename__ = "kpi_daily_totals"
+    
+    kpi_id = Column(Integer, ForeignKey("kpi_definitions.id"), nullable=False)
+    team_id = Column(Integer, ForeignKey("teams.id"), nullable=False)
+    region_id = Column(Integer, ForeignKey("regions.id"), nullable=False)
+    day = Column(Date, nullable=False)
+    # Cumulative from the first day of the series up to and including `day`.
+    # NUMERIC, because range aggregates are differences of these running sums.
+    cum_count = Column(Integer, nullable=False, default=0)
+    cum_sum = Column(Numeric, nullable=False, default=0)
+    cum_sumsq = Column(Numeric, nullable=False, default=0)
+    
+    __table_args__ = (
+        UniqueConstraint(kpi_id, team_id, region_id, day, name="uq_kpi_daily_totals_series_day"),
+    )
+
+
+class KPITarget(Base):
+    """Goal for a KPI over a period, per team and optionally per region."""
+    __tablename__ = "kpi_targets"
+    
+    kpi_id = Column(Integer, ForeignKey("kpi_definitions.id"), nullable=False)
+    team_id = Column(Integer, ForeignKey("teams.id"), nullable=False)
+    region_id = Column(Integer, ForeignKey("regions.id"), nullable=True)  # NULL means all regions
+    period_type = Column(String(10), nullable=False)  # 'month', 'quarter', 'year'
+    period_start = Column(Date, nullable=False)
+    target_value = Column(Float, nullable=False)
+    aggregation = Column(String(10), nullable=False, default="sum")  # 'sum', 'avg'
+    
+    __table_args__ = (
+        Index("idx_kpi_targets_period", kpi_id, period_start),
+    )
+
+
+class AlertRule(Base):
+    """User-defined alert rule for a KPI series."""
+    __tablename__ = "alert_rules"
+    
+    name = Column(String(100), nullable=False)
+    kpi_id = Column(Integer, ForeignKey("kpi_definitions.id"), nullable=False)
+    team_id = Column(Integer, ForeignKey("teams.id"), nullable=True)  # NULL matches any team
+    region_id = Column(Integer, ForeignKey("regions.id"), nullable=True)  # NULL matches any region
+    rule_type = Column(String(20), nullable=False)  # 'threshold', 'deviation'
+    operator = Column(String(2), nullable=True)  # '>', '>=', '<', '<=' for threshold rules
+    threshold = Column(Float, nullable=True)  # limit for threshold rules, z-score for deviation rules
+    window_size = Column(Integer, nullable=True)  # rolling window length for deviation rules
+    severity = Column(String(20), nullable=False, default="medium")  # 'low', 'medium', 'high'
+    active = Column(Boolean, nullable=False, default=True)
+    
+    __table_args__ = (
+        Index("idx_alert_rules_series", kpi_id, team_id, region_id),
+    )
+
+
+class BackfillCheckpoint(Base):
+    """Progress of one worker of a batched data backfill."""
+    __tablename__ = "backfill_checkpoints"
+    
+    job_name = Column(String(100), nullable=False)
+    worker = Column(Integer, nullable=False)
+    start_id = Column(Integer, nullable=False)  # exclusive
+    end_id = Column(Integer, nullable=False)  # inclusive
+    last_id = Column(Integer, nullable=False)  # last id processed, starts at start_id
+    rows_processed = Column(Integer, nullable=False, default=0)
+    status = Column(String(20), nullable=False, default="pending")  # 'pending', 'running', 'done'
+    updated_at = Column(DateTime, nullable=True)
+    
+    __table_args__ = (
+        UniqueConstraint(job_name, worker, name="uq_backfill_checkpoints_job_worker"),
+    )
+
+
+class TableVersion(Base):
+    """Change counter per table, bumped by a trigger on every write statement."""
+    __tablename__ = "table_versions"
+    
+    table_name = Column(String(100), nullable=False, unique=True)
+    version = Column(BigInteger, nullable=False, default=0)
+
+
 class QueryHistory(Base):
     """Query history model for tracking API usage."""
     __tablename__ = "query_history"
     
     query_text = Column(String, nullable=False)
     execution_time_ms = Column(Integer, nullable=True)
-    successful = Column(Integer, default=1)  # 1 for true, 0 for false 
\ No newline at end of file
+    successful = Column(Integer, default=1)  # 1 for true, 0 for false
+
+
+# Tables whose in-process caches reload when their table_versions row moves.
+# The trigger runs in the writing transaction, so the new version becomes
+# visible exactly when the change commits.
+VERSIONED_TABLES = ("teams", "regions", "kpi_definitions", "alert_rules")
+
+BUMP_TABLE_VERSION_FUNCTION = DDL("""
+    CREATE OR REPLACE FUNCTION bump_table_version() RETURNS trigger AS $$
+    BEGIN
+        INSERT INTO table_versions (table_name, version, created_at)
+        VALUES (TG_TABLE_NAME, 1, now())
+        ON CONFLICT (table_name) DO UPDATE SET version = table_versions.version + 1;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+""")
+
+event.listen(Base.metadata, "before_create", BUMP_TABLE_VERSION_FUNCTION.execute_if(dialect="postgresql"))
+for _table in VERSIONED_TABLES:
+    event.listen(
+        Base.metadata.tables[_table],
+        "after_create",
+        DDL(
+            f"CREATE TRIGGER trg_{_table}_version "
+            f"AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {_table} "
+            f"FOR EACH STATEMENT EXECUTE PROCEDURE bump_table_version()"
+        ).execute_if(dialect="postgresql"),
+    )
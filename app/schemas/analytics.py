@@ -0,0 +1,54 @@
+"""Structured analytics parameters produced by the Query Interpreter."""
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, Field, model_validator
+
+
+class Period(BaseModel):
+    """A year, quarter or month. Set at most one of quarter and month."""
+    year: int
+    quarter: Optional[int] = Field(None, ge=1, le=4)
+    month: Optional[int] = Field(None, ge=1, le=12)
+
+    @model_validator(mode="after")
+    def check_granularity(self):
+        if self.quarter is not None and self.month is not None:
+            raise ValueError("Set either quarter or month, not both")
+        return self
+
+    @property
+    def granularity(self):
+        """'month', 'quarter' or 'year'."""
+        if self.month is not None:
+            return "month"
+        if self.quarter is not None:
+            return "quarter"
+        return "year"
+
+
+class ComparisonParameters(BaseModel):
+    """Parameters for comparing a KPI between two periods."""
+    kpi: str
+    period1: Period
+    period2: Period
+    teams: List[str] = []
+    regions: List[str] = []
+    group_by: Literal["team", "region"] = "team"
+    aggregation: Literal["avg", "sum"] = "avg"
+
+    @model_validator(mode="after")
+    def check_periods(self):
+        if self.period1.granularity != self.period2.granularity:
+            raise ValueError("Both periods must have the same granularity")
+        return self
+
+
+class BenchmarkParameters(BaseModel):
+    """Parameters for ranking teams on a KPI within one period."""
+    kpi: str
+    period: Period
+    teams: List[str] = []  # Teams to report; ranking always uses all teams
+    regions: List[str] = []
+    aggregation: Literal["avg", "sum"] = "avg"
+    # Which values rank first; defaults to the KPI definition's higher_is_better
+    direction: Optional[Literal["higher", "lower"]] = None
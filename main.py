@@ -1,14 +1,48 @@
+import logging
+import threading
+from contextlib import asynccontextmanager
+
 import uvicorn
 from fastapi import FastAPI, Depends, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import settings
 from app.api.router import api_router
+from app.db.connector import db_connector
+from app.db.dimensions import dimension_cache
+from app.db.engines import dispose_engines
+
+logger = logging.getLogger(__name__)
+
+def warm_up():
+    """
+    Open one pooled primary connection and load the dimension cache.
+
+    Alert rules are not loaded here: API workers never ingest, and the
+    ingestion path loads them on its first batch.
+    """
+    try:
+        db_connector.execute_query("SELECT 1", use_primary=True)
+        dimension_cache.snapshot()
+        logger.info("Database warm-up complete")
+    except Exception as e:
+        logger.error(f"Database warm-up failed: {str(e)}")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm up the database in the background so startup is not blocked."""
+    app.state.warm_up = None
+    if settings.DB_WARM_UP:
+        app.state.warm_up = threading.Thread(target=warm_up, name="db-warm-up", daemon=True)
+        app.state.warm_up.start()
+    yield
+    dispose_engines()
 
 app = FastAPI(
     title="KPI Analytics System API",
     description="API for analyzing and generating insights from KPI data",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan
 )
 
 # Add CORS middleware
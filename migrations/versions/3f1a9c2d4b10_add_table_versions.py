@@ -0,0 +1,54 @@
+"""Add trigger-maintained table versions for cached tables
+
+Revision ID: 3f1a9c2d4b10
+Revises: 
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1a9c2d4b10'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+VERSIONED_TABLES = ("teams", "regions", "kpi_definitions", "alert_rules")
+
+
+def upgrade():
+    # Databases created by setup_db.py may already have the table
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS table_versions (
+            id SERIAL PRIMARY KEY,
+            table_name VARCHAR(100) NOT NULL UNIQUE,
+            version BIGINT NOT NULL DEFAULT 0,
+            created_at TIMESTAMP
+        )
+    """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION bump_table_version() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO table_versions (table_name, version, created_at)
+            VALUES (TG_TABLE_NAME, 1, now())
+            ON CONFLICT (table_name) DO UPDATE SET version = table_versions.version + 1;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    for table in VERSIONED_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_version ON {table}")
+        op.execute(
+            f"CREATE TRIGGER trg_{table}_version "
+            f"AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table} "
+            f"FOR EACH STATEMENT EXECUTE PROCEDURE bump_table_version()"
+        )
+
+
+def downgrade():
+    for table in VERSIONED_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_version ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS bump_table_version()")
+    op.drop_table("table_versions")
@@ -0,0 +1,50 @@
+"""Add keyset pagination indexes on kpi_data
+
+Revision ID: 8c2e5d7a1f34
+Revises: 3f1a9c2d4b10
+Create Date: 2026-10-19 09:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8c2e5d7a1f34'
+down_revision = '3f1a9c2d4b10'
+branch_labels = None
+depends_on = None
+
+# (index name, leading columns); each index ends in (timestamp, id)
+INDEXES = (
+    ("idx_kpi_data_timestamp_id", []),
+    ("idx_kpi_data_kpi_timestamp_id", ["kpi_id"]),
+    ("idx_kpi_data_team_timestamp_id", ["team_id"]),
+    ("idx_kpi_data_region_timestamp_id", ["region_id"]),
+)
+
+
+def upgrade():
+    # CONCURRENTLY keeps kpi_data writable during the build but cannot run in
+    # a transaction. If a build fails it leaves an INVALID index behind; drop
+    # it before re-running, since IF NOT EXISTS would skip it.
+    with op.get_context().autocommit_block():
+        for name, columns in INDEXES:
+            op.create_index(
+                name,
+                "kpi_data",
+                columns + ["timestamp", "id"],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name="kpi_data",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,31 @@
+"""Add rule id and score to anomalies
+
+Revision ID: a47b0e93c6d2
+Revises: 8c2e5d7a1f34
+Create Date: 2026-10-19 09:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a47b0e93c6d2'
+down_revision = '8c2e5d7a1f34'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("anomalies", sa.Column("rule_id", sa.Integer(), nullable=True))
+    op.add_column("anomalies", sa.Column("score", sa.Float(), nullable=True))
+    op.create_foreign_key(
+        "anomalies_rule_id_fkey", "anomalies", "alert_rules",
+        ["rule_id"], ["id"], ondelete="SET NULL",
+    )
+
+
+def downgrade():
+    op.drop_constraint("anomalies_rule_id_fkey", "anomalies", type_="foreignkey")
+    op.drop_column("anomalies", "score")
+    op.drop_column("anomalies", "rule_id")
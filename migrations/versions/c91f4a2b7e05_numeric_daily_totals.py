@@ -0,0 +1,40 @@
+"""Store kpi_daily_totals running sums as NUMERIC
+
+Revision ID: c91f4a2b7e05
+Revises: a47b0e93c6d2
+Create Date: 2026-10-19 09:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c91f4a2b7e05'
+down_revision = 'a47b0e93c6d2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Rewrites the table; the values keep any error already accumulated in
+    # floating point until scripts/rebuild_daily_totals.py is run
+    for column in ("cum_sum", "cum_sumsq"):
+        op.alter_column(
+            "kpi_daily_totals", column,
+            type_=sa.Numeric(),
+            existing_type=sa.Float(),
+            existing_nullable=False,
+            postgresql_using=f"{column}::numeric",
+        )
+
+
+def downgrade():
+    for column in ("cum_sum", "cum_sumsq"):
+        op.alter_column(
+            "kpi_daily_totals", column,
+            type_=sa.Float(),
+            existing_type=sa.Numeric(),
+            existing_nullable=False,
+            postgresql_using=f"{column}::double precision",
+        )
@@ -0,0 +1,32 @@
+"""Add higher_is_better to kpi_definitions
+
+Revision ID: d2a86f1c3b49
+Revises: c91f4a2b7e05
+Create Date: 2026-10-19 09:40:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd2a86f1c3b49'
+down_revision = 'c91f4a2b7e05'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # A constant default is a metadata-only change; existing KPIs rank higher-first
+    op.add_column(
+        "kpi_definitions",
+        sa.Column("higher_is_better", sa.Boolean(), nullable=False, server_default=sa.true()),
+    )
+    op.execute("""
+        UPDATE kpi_definitions SET higher_is_better = FALSE
+        WHERE name IN ('customer_acquisition_cost', 'support_response_time')
+    """)
+
+
+def downgrade():
+    op.drop_column("kpi_definitions", "higher_is_better")
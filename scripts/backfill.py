@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Run a batched, resumable data backfill on the KPI Analytics System database.
+
+Usage:
+    python scripts/backfill.py recompute_week --workers 4
+    python scripts/backfill.py recompute_week --status
+    python scripts/backfill.py recompute_week --reset
+
+Interrupting a run is safe; running the same command again resumes from the
+last committed chunk of each worker.
+"""
+import sys
+import os
+import argparse
+from dataclasses import replace
+from pathlib import Path
+
+# Add the parent directory to sys.path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.db.backfill import JOBS, job_status, reset_job, run_job
+
+def print_status(job_name):
+    """Print per-worker progress for a job."""
+    rows = job_status(job_name)
+    if not rows:
+        print(f"No checkpoints for '{job_name}'")
+        return
+    for row in rows:
+        span = max(row.end_id - row.start_id, 1)
+        done = min(max(row.last_id - row.start_id, 0) / span, 1.0)
+        print(
+            f"Worker {row.worker}: ids {row.start_id + 1}-{row.end_id}, "
+            f"{done:.0%} ({row.rows_processed} rows updated), {row.status}"
+        )
+
+def main():
+    """Run, inspect or reset a backfill job."""
+    parser = argparse.ArgumentParser(description="Run a batched data backfill")
+    parser.add_argument("job", choices=sorted(JOBS), help="Backfill job to run")
+    parser.add_argument("--workers", type=int, default=4, help="Parallel workers (first run only)")
+    parser.add_argument("--chunk-size", type=int, help="Rows per transaction")
+    parser.add_argument("--sleep", type=float, help="Seconds to pause between chunks")
+    parser.add_argument("--status", action="store_true", help="Show progress and exit")
+    parser.add_argument("--reset", action="store_true", help="Delete checkpoints and exit")
+    args = parser.parse_args()
+
+    job = JOBS[args.job]
+    if args.chunk_size:
+        job = replace(job, chunk_size=args.chunk_size)
+    if args.sleep is not None:
+        job = replace(job, sleep_seconds=args.sleep)
+
+    try:
+        if args.status:
+            print_status(job.name)
+            return 0
+        if args.reset:
+            reset_job(job.name)
+            print(f"✅ Checkpoints for '{job.name}' deleted")
+            return 0
+
+        print(f"Running backfill '{job.name}' with up to {args.workers} workers...")
+        rows = run_job(job, args.workers)
+        print(f"✅ Backfill complete, {rows} rows updated")
+        print_status(job.name)
+        return 0
+    except KeyboardInterrupt:
+        print("\nInterrupted; run the same command again to resume.")
+        return 1
+    except Exception as e:
+        print(f"❌ Backfill failed: {e}")
+        return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
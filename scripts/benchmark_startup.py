@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Cold start benchmark for the API process.
+
+This script measures, in a fresh interpreter per run:
+1. Time to import the FastAPI app
+2. Startup time (lifespan hook, plus the warm-up thread when enabled)
+3. Latency of the first and of a second DB-backed request
+
+Runs once with DB_WARM_UP=False, where the first request pays for engine
+creation and the dimension cache, and once with warm-up enabled and finished
+before the first request. Requires a reachable, seeded database.
+"""
+import sys
+import os
+import subprocess
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+RUNS = 5
+ENDPOINT = "/api/v1/kpi-data/?limit=1"
+
+REQUEST_SCRIPT = """
+import sys
+import time
+start = time.perf_counter()
+from fastapi.testclient import TestClient
+import main
+imported = time.perf_counter()
+from app.config import settings
+headers = {settings.API_KEY_NAME: settings.API_KEY}
+with TestClient(main.app) as client:
+    if main.app.state.warm_up is not None:
+        main.app.state.warm_up.join()
+    started = time.perf_counter()
+    first_response = client.get(sys.argv[1], headers=headers)
+    first = time.perf_counter()
+    client.get(sys.argv[1], headers=headers)
+    second = time.perf_counter()
+first_response.raise_for_status()
+print(imported - start, started - imported, first - started, second - first)
+"""
+
+LABELS = ("App import", "Startup", "First request", "Second request")
+
+def measure(warm_up):
+    """Return (import, startup, first request, second request) times from a new interpreter."""
+    env = dict(os.environ, DB_WARM_UP=str(warm_up))
+    result = subprocess.run(
+        [sys.executable, "-c", REQUEST_SCRIPT, ENDPOINT],
+        cwd=ROOT,
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True
+    )
+    return tuple(float(value) for value in result.stdout.split()[-4:])
+
+def report(title, runs):
+    """Print median timings for one mode and return the median time to first response."""
+    median = len(runs) // 2
+    print(title)
+    for index, label in enumerate(LABELS):
+        values = sorted(times[index] for times in runs)
+        print(f"  {label}: {values[median] * 1000:.1f} ms (median)")
+    to_first = sorted(sum(times[:3]) for times in runs)[median]
+    print(f"  Import to first response: {to_first * 1000:.1f} ms\n")
+    return to_first
+
+def main():
+    """Main function."""
+    print(f"Running cold start benchmark against {ENDPOINT} ({RUNS} runs each)...\n")
+
+    try:
+        lazy_runs = [measure(warm_up=False) for _ in range(RUNS)]
+        warm_runs = [measure(warm_up=True) for _ in range(RUNS)]
+    except subprocess.CalledProcessError as e:
+        print(f"❌ Benchmark failed: {e.stderr.strip().splitlines()[-1] if e.stderr else e}")
+        return 1
+
+    lazy = report("Without warm-up (first request initializes the database):", lazy_runs)
+    report("With warm-up (finished before the first request):", warm_runs)
+
+    status = "✅" if lazy < 1.0 else "❌"
+    print(f"{status} Cold start to first DB-backed response: {lazy * 1000:.1f} ms")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -25,7 +25,7 @@ def main():
         print("✅ Connection successful!")
         
         # Check if important tables exist
-        tables = ["teams", "regions", "kpi_definitions", "kpi_data", "anomalies", "query_history"]
+        tables = ["teams", "regions", "kpi_definitions", "kpi_data", "anomalies", "kpi_daily_totals", "kpi_targets", "alert_rules", "backfill_checkpoints", "table_versions", "query_history"]
         for table in tables:
             try:
                 count = db_connector.count_records(table)
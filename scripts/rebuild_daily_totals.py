@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Rebuild the running daily totals used by goal tracking.
+
+Run this once on a database whose kpi_data was loaded without going through
+ingestion (e.g. an existing or restored database), or after correcting
+historical data. Ingestion is blocked while the rebuild runs.
+"""
+import sys
+import os
+from pathlib import Path
+
+# Add the parent directory to sys.path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.db.connector import db_connector
+from app.db.prefix_sums import rebuild_daily_totals
+
+def main():
+    """Rebuild kpi_daily_totals from kpi_data."""
+    print("Rebuilding daily totals from kpi_data...")
+
+    try:
+        with db_connector.get_session() as session:
+            rebuild_daily_totals(session)
+        print(f"✅ Daily totals rebuilt ({db_connector.count_records('kpi_daily_totals')} rows)")
+        return 0
+    except Exception as e:
+        print(f"❌ Failed to rebuild daily totals: {e}")
+        return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,7 +14,9 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from sqlalchemy.orm import Session
 from app.db.connector import db_connector
-from app.models import Team, Region, KPIDefinition, KPIData, Anomaly
+from app.db.dimensions import dimension_cache
+from app.db.ingest import ingest_kpi_data
+from app.models import Team, Region, KPIDefinition, Anomaly
 
 def seed_teams(session: Session) -> None:
     """Seed the teams table with initial data."""
@@ -61,13 +63,15 @@ def seed_kpi_definitions(session: Session) -> None:
             "name": "customer_acquisition_cost",
             "description": "Average cost to acquire a new customer",
             "unit": "USD",
-            "category": "marketing"
+            "category": "marketing",
+            "higher_is_better": False
         },
         {
             "name": "support_response_time",
             "description": "Average time to first response for support tickets",
             "unit": "minutes",
-            "category": "operations"
+            "category": "operations",
+            "higher_is_better": False
         }
     ]
     
@@ -81,10 +85,12 @@ def seed_kpi_definitions(session: Session) -> None:
 
 def seed_sample_kpi_data(session: Session) -> None:
     """Seed a small amount of sample KPI data."""
-    # Get reference IDs
-    teams = {team.name: team.id for team in session.query(Team).all()}
-    regions = {region.name: region.id for region in session.query(Region).all()}
-    kpis = {kpi.name: kpi.id for kpi in session.query(KPIDefinition).all()}
+    # Get reference IDs from the dimension cache (reloaded after the inserts above)
+    dimension_cache.invalidate()
+    snapshot = dimension_cache.snapshot()
+    teams = snapshot.teams.ids
+    regions = snapshot.regions.ids
+    kpis = snapshot.kpis.ids
     
     # Create some sample data points
     today = datetime.now()
@@ -140,11 +146,8 @@ def seed_sample_kpi_data(session: Session) -> None:
         }
     ]
     
-    for data in data_points:
-        kpi_data = KPIData(**data)
-        session.add(kpi_data)
-    
-    session.commit()
+    # Ingest like live data so daily totals and alerts are maintained
+    ingest_kpi_data(data_points)
     print(f"✅ Added {len(data_points)} sample KPI data points")
 
 
@@ -16,11 +16,12 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 import psycopg2
 from sqlalchemy_utils import database_exists, create_database
-from sqlalchemy import create_engine, inspect
+from sqlalchemy import inspect
 
 from app.config import settings
+from app.db.engines import get_engine
 from app.models.base import Base
-from app.models.tables import Team, Region, KPIDefinition, KPIData, Anomaly, QueryHistory
+from app.models.tables import Team, Region, KPIDefinition, KPIData, Anomaly, KPIDailyTotal, KPITarget, AlertRule, BackfillCheckpoint, TableVersion, QueryHistory
 
 def test_connection():
     """Test the connection to PostgreSQL."""
@@ -63,11 +64,9 @@ def setup_database():
 
 def create_tables():
     """Create all tables in the database."""
-    from sqlalchemy import create_engine
-    
     print("Creating tables...")
     
-    engine = create_engine(settings.DATABASE_URL)
+    engine = get_engine()
     
     # Create all tables
     try: